@@ -0,0 +1,148 @@
+##############################################################
+###          S P A C E   E S C A P E  -  A S S E T S       ###
+##############################################################
+### Sons e música são decodificados numa thread de fundo   ###
+### enquanto a introdução já aparece; imagens só carregam  ###
+### no primeiro uso. Os pixels já escalados ficam num      ###
+### cache em disco (hash do arquivo + tamanho), e as       ###
+### próximas execuções pulam a decodificação do PNG.       ###
+##############################################################
+
+import hashlib
+import os
+import struct
+import threading
+import time
+
+import pygame
+
+from saveSystem import write_atomic
+
+ASSET_CACHE_DIR = ".asset_cache"
+CACHE_HEADER = struct.Struct("<4sII")  # Assinatura, largura, altura
+CACHE_MAGIC = b"SEPX"
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class AssetManager:
+    """Carrega imagens sob demanda e sons em segundo plano"""
+
+    def __init__(self, cache_dir=ASSET_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.images = {}
+        self.sounds = {}  # Preenchido pela thread; nome ausente = ainda carregando
+        self.audio_thread = None
+        self.audio_ready = threading.Event()
+
+        # Estatísticas do cache em disco
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.load_ms = 0.0
+
+    # ------------------------------------------------------
+    # IMAGENS
+    # ------------------------------------------------------
+    def image(self, filename, fallback_color, size=None):
+        """Imagem convertida para a tela (precisa de display.set_mode antes)"""
+        key = (filename, size)
+        img = self.images.get(key)
+        if img is None:
+            start = time.perf_counter()
+            img = self.images[key] = self._load_image(filename, fallback_color, size)
+            self.load_ms += (time.perf_counter() - start) * 1000
+        return img
+
+    def _load_image(self, filename, fallback_color, size):
+        if not os.path.exists(filename):
+            surf = pygame.Surface(size or (50, 50))
+            surf.fill(fallback_color)
+            return surf
+
+        digest = file_digest(filename)
+        cache_path = self._cache_path(digest, size)
+        img = self._read_cached(cache_path)
+        if img is not None:
+            self.cache_hits += 1
+            return img.convert_alpha()
+
+        self.cache_misses += 1
+        img = pygame.image.load(filename).convert_alpha()
+        if size:
+            img = pygame.transform.scale(img, size)
+        self._write_cached(cache_path, img)
+        return img
+
+    def _cache_path(self, digest, size):
+        suffix = f"{size[0]}x{size[1]}" if size else "orig"
+        return os.path.join(self.cache_dir, f"{digest}-{suffix}.rgba")
+
+    def _read_cached(self, path):
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            magic, width, height = CACHE_HEADER.unpack_from(data)
+            if magic != CACHE_MAGIC or len(data) != CACHE_HEADER.size + width * height * 4:
+                return None
+            return pygame.image.frombytes(data[CACHE_HEADER.size:], (width, height), "RGBA")
+        except (OSError, struct.error, ValueError):
+            return None
+
+    def _write_cached(self, path, img):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            header = CACHE_HEADER.pack(CACHE_MAGIC, img.get_width(), img.get_height())
+            write_atomic(path, header + pygame.image.tobytes(img, "RGBA"))
+        except OSError as e:
+            print(f"Erro ao gravar cache de imagem: {e}")
+
+    # ------------------------------------------------------
+    # ÁUDIO
+    # ------------------------------------------------------
+    def load_audio_async(self, sounds, music=None, music_volume=0.3):
+        """Inicia o mixer, decodifica os sons e começa a música numa thread"""
+        self.audio_thread = threading.Thread(target=self._load_audio, args=(sounds, music, music_volume),
+                                             name="asset-audio", daemon=True)
+        self.audio_thread.start()
+
+    def _load_audio(self, sounds, music, music_volume):
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Erro ao iniciar o áudio: {e}")
+            self.audio_ready.set()
+            return
+
+        for filename in sounds:
+            sound = None
+            if os.path.exists(filename):
+                try:
+                    sound = pygame.mixer.Sound(filename)
+                except pygame.error as e:
+                    print(f"Erro ao carregar som {filename}: {e}")
+            self.sounds[filename] = sound
+
+        if music and os.path.exists(music):
+            try:
+                pygame.mixer.music.load(music)
+                pygame.mixer.music.set_volume(music_volume)
+                pygame.mixer.music.play(-1)
+            except pygame.error as e:
+                print(f"Erro ao carregar música: {e}")
+        self.audio_ready.set()
+
+    def sound(self, filename):
+        """Som já decodificado, ou None se não existe ou ainda está carregando"""
+        return self.sounds.get(filename)
+
+    def stop_music(self):
+        if self.audio_ready.is_set() and pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+
+    def report(self):
+        return (f"Assets: {len(self.images)} imagens em {self.load_ms:.1f} ms "
+                f"({self.cache_hits} do cache em disco, {self.cache_misses} decodificadas)")
@@ -0,0 +1,96 @@
+##############################################################
+###           S P A C E   E S C A P E  -  Á U D I O        ###
+##############################################################
+### Os efeitos sonoros pedidos durante o quadro entram     ###
+### numa fila; no fim do quadro cada categoria toca no     ###
+### máximo uma vez, nos seus próprios canais. Pedidos      ###
+### repetidos dentro de uma janela curta viram um só, e há ###
+### um limite de sons por quadro.                          ###
+##############################################################
+
+import pygame
+
+COALESCE_MS = 60  # Pedidos iguais mais próximos que isso tocam uma vez só
+MAX_PLAYS_PER_FRAME = 1  # Abaixo do número de categorias, senão o limite nunca corta nada
+CHANNELS_PER_CATEGORY = 2
+
+
+class AudioScheduler:
+    """Agenda os efeitos sonoros do jogo com um conjunto de canais por categoria"""
+
+    def __init__(self, get_sound, sound_files, channels_per_category=CHANNELS_PER_CATEGORY,
+                 coalesce_ms=COALESCE_MS, max_plays_per_frame=MAX_PLAYS_PER_FRAME):
+        self.get_sound = get_sound  # Devolve o Sound de um arquivo, ou None se ainda não carregou
+        self.sound_files = sound_files  # Categoria -> arquivo
+        self.channels_per_category = channels_per_category
+        self.coalesce_ms = coalesce_ms
+        self.max_plays_per_frame = max_plays_per_frame
+
+        self.pending = {}  # Categoria -> pedidos neste quadro, na ordem de chegada
+        self.last_play = {}
+        self.pools = None  # Criados quando o mixer estiver pronto
+        self.next_channel = {}
+
+        self.requested = 0
+        self.played = 0
+        self.coalesced = 0  # Juntados a outro pedido da mesma categoria
+        self.dropped = 0  # Cortados pelo limite por quadro
+        self.unavailable = 0  # Sem som carregado ou sem mixer
+
+    def request(self, category):
+        """Pede um efeito; só toca no próximo flush"""
+        self.requested += 1
+        self.pending[category] = self.pending.get(category, 0) + 1
+
+    def _build_pools(self):
+        """Reserva canais próprios para cada categoria (a música usa outro fluxo)"""
+        if not pygame.mixer.get_init():
+            return False
+        total = self.channels_per_category * len(self.sound_files)
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total))
+        pygame.mixer.set_reserved(total)
+        self.pools = {}
+        for n, category in enumerate(self.sound_files):
+            first = n * self.channels_per_category
+            self.pools[category] = [pygame.mixer.Channel(first + i) for i in range(self.channels_per_category)]
+            self.next_channel[category] = 0
+        return True
+
+    def _channel(self, category):
+        """Um canal livre da categoria ou, se todos tocam, o mais antigo"""
+        pool = self.pools[category]
+        for channel in pool:
+            if not channel.get_busy():
+                return channel
+        i = self.next_channel[category]
+        self.next_channel[category] = (i + 1) % len(pool)
+        return pool[i]
+
+    def flush(self, now_ms):
+        """Toca os pedidos do quadro; chamado uma vez por quadro"""
+        if not self.pending:
+            return
+        plays = 0
+        for category, count in self.pending.items():
+            # Só um toque por categoria por quadro; o resto foi juntado
+            self.coalesced += count - 1
+            last = self.last_play.get(category)
+            if last is not None and now_ms - last < self.coalesce_ms:
+                self.coalesced += 1
+                continue
+            if plays >= self.max_plays_per_frame:
+                self.dropped += 1
+                continue
+            sound = self.get_sound(self.sound_files[category])
+            if sound is None or (self.pools is None and not self._build_pools()):
+                self.unavailable += 1
+                continue
+            self._channel(category).play(sound)
+            self.last_play[category] = now_ms
+            self.played += 1
+            plays += 1
+        self.pending.clear()
+
+    def report(self):
+        return (f"Áudio: {self.requested} pedidos, {self.played} tocados, {self.coalesced} juntados, "
+                f"{self.dropped} cortados pelo limite, {self.unavailable} sem som")
@@ -0,0 +1,219 @@
+##############################################################
+###     S P A C E   E S C A P E  -  V A R R E D U R A      ###
+##############################################################
+### Varre uma grade de constantes de balanceamento (chance ###
+### de power-up e bônus, duração da arma, cooldown do      ###
+### tiro, velocidade dos meteoros, pontos para a vitória)  ###
+### rodando milhares de partidas sem tela num pool de      ###
+### processos, um por núcleo. Cada lote volta assim que    ###
+### termina e entra no resumo de sobrevivência, pontuação  ###
+### e taxa de vitória de cada combinação.                  ###
+##############################################################
+
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+from batchEnv import BatchEnv, random_actions
+from gameCore import (
+    TICK_RATE, BASE_TICK_MS, CONDICAO_VITORIA, FIRE_COOLDOWN, WEAPON_UPGRADE_DURATION,
+    INPUT_LEFT, INPUT_RIGHT, INPUT_FIRE, GameRules,
+)
+
+GAMES_PER_CELL = 512
+GAMES_PER_TASK = 128  # Partidas por lote enviado a um processo
+MAX_TICKS = 5 * 60 * TICK_RATE  # Partidas vivas depois de 5 min contam como truncadas
+
+# Parâmetro -> valor padrão. win_score não muda a partida, só o que conta como vitória
+PARAMETERS = {
+    "powerup_odds": 1,
+    "bonus_odds": 2,
+    "weapon_upgrade_duration": WEAPON_UPGRADE_DURATION,
+    "fire_cooldown": FIRE_COOLDOWN,
+    "meteor_speed": 5,
+    "win_score": CONDICAO_VITORIA,
+}
+
+
+# ----------------------------------------------------------
+# POLÍTICAS
+# ----------------------------------------------------------
+def policy_random(rng, inputs, tick):
+    """A random_policy do núcleo"""
+    return random_actions(rng, inputs)
+
+
+def policy_sweep(rng, inputs, tick):
+    """Atira sempre e varre a tela de um lado para o outro"""
+    inputs[:] = INPUT_FIRE | (INPUT_LEFT if (tick // 90) % 2 else INPUT_RIGHT)
+    return inputs
+
+
+def policy_still(rng, inputs, tick):
+    """Fica parado atirando"""
+    inputs[:] = INPUT_FIRE
+    return inputs
+
+
+POLICIES = {
+    "aleatoria": policy_random,
+    "varredura": policy_sweep,
+    "parada": policy_still,
+}
+
+
+# ----------------------------------------------------------
+# PROCESSOS
+# ----------------------------------------------------------
+def run_task(task):
+    """Roda um lote de partidas até todas acabarem (ou MAX_TICKS).
+    Executado nos processos do pool; devolve só arrays pequenos."""
+    cell, params, games, seed, policy_name, max_ticks = task
+    rules = GameRules(**{name: value for name, value in params.items() if name != "win_score"})
+    seeds = seed.spawn(2)
+    env = BatchEnv(games, seed=seeds[0], rules=rules, auto_reset=False)
+    rng = np.random.default_rng(seeds[1])
+    policy = POLICIES[policy_name]
+    inputs = np.full(games, INPUT_FIRE)
+
+    tick = 0
+    while tick < max_ticks and not env.done.all():
+        env.step(policy(rng, inputs, tick))
+        tick += 1
+    # Sem auto_reset cada partida para no seu game over: pontuação e relógio
+    # ficam com os valores daquele tick
+    survival = np.rint(env.time / BASE_TICK_MS).astype(np.int64)
+    return cell, env.score.copy(), survival, env.done.copy()
+
+
+def build_grid(specs):
+    """Combinações de parâmetros a partir de 'nome=v1,v2,...'"""
+    values = {name: [default] for name, default in PARAMETERS.items()}
+    for spec in specs:
+        name, _, listed = spec.partition("=")
+        if name not in PARAMETERS or not listed:
+            raise ValueError(f"parâmetro inválido: {spec} (conhecidos: {', '.join(PARAMETERS)})")
+        values[name] = [int(value) for value in listed.split(",")]
+    names = list(values)
+    return [dict(zip(names, combo)) for combo in itertools.product(*values.values())]
+
+
+def sweep_tasks(grid, games, seed, policy, max_ticks, games_per_task=GAMES_PER_TASK):
+    """Divide cada combinação em lotes com sementes independentes"""
+    seeds = iter(np.random.SeedSequence(seed).spawn(len(grid) * -(-games // games_per_task)))
+    tasks = []
+    for cell, params in enumerate(grid):
+        for start in range(0, games, games_per_task):
+            tasks.append((cell, params, min(games_per_task, games - start), next(seeds), policy, max_ticks))
+    return tasks
+
+
+# ----------------------------------------------------------
+# RESUMO
+# ----------------------------------------------------------
+class CellStats:
+    """Resultados acumulados de uma combinação de parâmetros"""
+
+    def __init__(self, params):
+        self.params = params
+        self.scores = []
+        self.survival = []
+        self.over = []
+
+    def add(self, scores, survival, over):
+        self.scores.append(scores)
+        self.survival.append(survival)
+        self.over.append(over)
+
+    def summary(self):
+        scores = np.concatenate(self.scores)
+        seconds = np.concatenate(self.survival) / TICK_RATE
+        over = np.concatenate(self.over)
+        p10, p50, p90 = np.percentile(scores, (10, 50, 90))
+        return {
+            **self.params,
+            "partidas": len(scores),
+            "truncadas": int(np.count_nonzero(~over)),
+            "sobrevivencia_media_s": float(seconds.mean()),
+            "sobrevivencia_p50_s": float(np.median(seconds)),
+            "pontos_media": float(scores.mean()),
+            "pontos_p10": float(p10),
+            "pontos_p50": float(p50),
+            "pontos_p90": float(p90),
+            # Vitória como no jogo: pontuação final acima da condição
+            "taxa_vitoria": float(np.count_nonzero(over & (scores >= self.params["win_score"])) / len(scores)),
+        }
+
+
+def print_table(rows, varied):
+    header = "".join(f"{name:>24}" for name in varied)
+    print(f"{header}{'partidas':>9}{'sobrev. s':>10}{'p50 s':>7}{'pontos':>8}{'p10':>6}{'p50':>6}"
+          f"{'p90':>6}{'vitória':>9}")
+    for row in rows:
+        cells = "".join(f"{row[name]:>24}" for name in varied)
+        print(f"{cells}{row['partidas']:>9}{row['sobrevivencia_media_s']:>10.1f}"
+              f"{row['sobrevivencia_p50_s']:>7.1f}{row['pontos_media']:>8.1f}{row['pontos_p10']:>6.0f}"
+              f"{row['pontos_p50']:>6.0f}{row['pontos_p90']:>6.0f}{row['taxa_vitoria']:>9.1%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Varredura Monte Carlo das constantes de balanceamento do Space Escape",
+        epilog="exemplo: balanceSweep.py meteor_speed=4,5,6 fire_cooldown=200,300")
+    parser.add_argument("grid", nargs="*", metavar="PARAM=V1,V2",
+                        help=f"valores a testar; os outros ficam no padrão ({', '.join(PARAMETERS)})")
+    parser.add_argument("--games", type=int, default=GAMES_PER_CELL, help="partidas por combinação")
+    parser.add_argument("--policy", choices=list(POLICIES), default="aleatoria", help="política dos jogadores")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS, help="limite de ticks por partida")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processos (padrão: um por núcleo)")
+    parser.add_argument("--seed", type=int, default=None, help="semente da varredura")
+    parser.add_argument("--csv", metavar="ARQUIVO", help="grava o resumo de cada combinação num CSV")
+    args = parser.parse_args(argv)
+
+    try:
+        grid = build_grid(args.grid)
+    except ValueError as e:
+        parser.error(str(e))
+    varied = [name for name in PARAMETERS if len({params[name] for params in grid}) > 1]
+    tasks = sweep_tasks(grid, args.games, args.seed, args.policy, args.max_ticks)
+    stats = [CellStats(params) for params in grid]
+    print(f"  {len(grid)} combinações x {args.games} partidas em {len(tasks)} lotes, {args.workers} processos")
+
+    # Os lotes voltam na ordem em que terminam; nada é compartilhado entre processos
+    start = time.perf_counter()
+    done_tasks = 0
+    with multiprocessing.Pool(args.workers) as pool:
+        for cell, scores, survival, over in pool.imap_unordered(run_task, tasks):
+            stats[cell].add(scores, survival, over)
+            done_tasks += 1
+            print(f"\r  {done_tasks}/{len(tasks)} lotes", end="", flush=True)
+    elapsed = time.perf_counter() - start
+    print()
+
+    rows = [cell.summary() for cell in stats]
+    print_table(rows, varied or ["win_score"])
+    games = sum(row["partidas"] for row in rows)
+    truncated = sum(row["truncadas"] for row in rows)
+    print(f"✓ {games} partidas em {elapsed:.1f}s ({games / elapsed:.0f} partidas/s)"
+          + (f"; {truncated} truncadas em {args.max_ticks} ticks" if truncated else ""))
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"✓ Resumo gravado em {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
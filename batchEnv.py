@@ -0,0 +1,285 @@
+##############################################################
+###       S P A C E   E S C A P E  -  B A T C H   E N V    ###
+##############################################################
+### K partidas empilhadas em arrays NumPy, avançadas todas ###
+### de uma vez por um passo vetorizado com as mesmas       ###
+### regras do núcleo (sorteio dos meteoros, mísseis,       ###
+### escudos, upgrade de arma, vidas). Para bots e testes   ###
+### automáticos: nenhum loop Python por partida.           ###
+##############################################################
+
+import time
+
+import numpy as np
+
+from gameCore import (
+    WIDTH, HEIGHT, BASE_TICK_MS, PLAYER_SIZE, METEOR_SIZE, MISSILE_SIZE, MAX_SHIELD,
+    METEOR_TYPE_NORMAL, METEOR_TYPE_BONUS, METEOR_TYPE_POWERUP,
+    INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN, INPUT_FIRE,
+    GameRules, roll_meteors,
+)
+
+MAX_MISSILES = 32  # Mísseis simultâneos por partida; tiros sem vaga são perdidos
+
+# Colunas de ações quando `actions` é (K, 5); (K,) é uma máscara INPUT_*
+ACTION_BITS = np.array([INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN, INPUT_FIRE])
+
+# Observação: 7 valores da nave seguidos de (x, y, tipo) de cada meteoro
+OBS_PLAYER_X = 0
+OBS_PLAYER_Y = 1
+OBS_SHIELD = 2
+OBS_LIVES = 3
+OBS_WEAPON = 4
+OBS_WEAPON_LEFT = 5  # ms restantes do upgrade de arma
+OBS_SCORE = 6
+OBS_METEORS = 7
+
+PLAYER_W, PLAYER_H = PLAYER_SIZE
+METEOR_W, METEOR_H = METEOR_SIZE
+MISSILE_W, MISSILE_H = MISSILE_SIZE
+START_X = WIDTH // 2 - PLAYER_W // 2
+START_Y = HEIGHT - 60 - PLAYER_H // 2
+# Onde nascem os mísseis em relação à nave: centro, e no tiro triplo as pontas
+MISSILE_OFFSETS = (PLAYER_W // 2 - 3, 10, PLAYER_W - 16)
+
+
+class BatchEnv:
+    """K partidas simultâneas com um passo vetorizado a 60 ticks/s.
+
+    Diferenças em relação ao núcleo, só em casos raros dentro de um mesmo
+    tick: cada míssil acerta no máximo o primeiro meteoro que sobrepõe e
+    um meteoro acertado por vários mísseis consome só o primeiro; batidas
+    em meteoros normais gastam escudo antes de bônus e power-ups do mesmo
+    tick serem aplicados.
+    """
+
+    def __init__(self, num_games, seed=None, rules=None, max_missiles=MAX_MISSILES, auto_reset=True):
+        self.rules = rules or GameRules()
+        self.num_games = num_games
+        self.num_meteors = self.rules.initial_meteors
+        self.auto_reset = auto_reset  # Partidas terminadas recomeçam no fim do step
+        self.rng = np.random.default_rng(seed)
+        k, m = num_games, self.num_meteors
+
+        self.player_x = np.zeros(k, dtype=np.int32)
+        self.player_y = np.zeros(k, dtype=np.int32)
+        self.meteor_x = np.zeros((k, m), dtype=np.int32)
+        self.meteor_y = np.zeros((k, m), dtype=np.int32)
+        self.meteor_type = np.zeros((k, m), dtype=np.int8)
+        self.missile_x = np.zeros((k, max_missiles), dtype=np.int32)
+        self.missile_y = np.zeros((k, max_missiles), dtype=np.int32)
+        self.missile_alive = np.zeros((k, max_missiles), dtype=bool)
+
+        self.score = np.zeros(k, dtype=np.int64)
+        self.lives = np.zeros(k, dtype=np.int64)
+        self.shield = np.zeros(k, dtype=np.int64)
+        self.weapon = np.zeros(k, dtype=bool)
+        self.weapon_until = np.zeros(k)
+        self.last_shot = np.zeros(k)
+        self.time = np.zeros(k)
+        self.done = np.zeros(k, dtype=bool)
+
+        self.observation = np.zeros((k, OBS_METEORS + 3 * m), dtype=np.float32)
+        self.games_finished = 0
+        self.finished_scores = []  # Pontuação final de cada partida terminada
+
+        self.reset()
+
+    @property
+    def observation_size(self):
+        return self.observation.shape[1]
+
+    def reset(self, mask=None):
+        """Recomeça as partidas de `mask` (todas se None) e devolve a observação"""
+        rows = np.arange(self.num_games) if mask is None else np.asarray(mask).nonzero()[0]
+        n, m = len(rows), self.num_meteors
+        self.player_x[rows] = START_X
+        self.player_y[rows] = START_Y
+        xs, ys, types = roll_meteors(self.rng, n * m, -500, self.rules)
+        self.meteor_x[rows] = xs.reshape(n, m)
+        self.meteor_y[rows] = ys.reshape(n, m)
+        self.meteor_type[rows] = types.reshape(n, m)
+        self.missile_alive[rows] = False
+
+        self.score[rows] = 0
+        self.lives[rows] = self.rules.initial_lives
+        self.shield[rows] = 0
+        self.weapon[rows] = False
+        self.weapon_until[rows] = 0
+        self.last_shot[rows] = 0
+        self.time[rows] = 0
+        self.done[rows] = False
+        return self._observe().copy()
+
+    def _observe(self):
+        obs = self.observation
+        obs[:, OBS_PLAYER_X] = self.player_x
+        obs[:, OBS_PLAYER_Y] = self.player_y
+        obs[:, OBS_SHIELD] = self.shield
+        obs[:, OBS_LIVES] = self.lives
+        obs[:, OBS_WEAPON] = self.weapon
+        obs[:, OBS_WEAPON_LEFT] = np.where(self.weapon, np.maximum(self.weapon_until - self.time, 0), 0)
+        obs[:, OBS_SCORE] = self.score
+        obs[:, OBS_METEORS::3] = self.meteor_x
+        obs[:, OBS_METEORS + 1::3] = self.meteor_y
+        obs[:, OBS_METEORS + 2::3] = self.meteor_type
+        return obs
+
+    def _respawn(self, mask, top):
+        rows, cols = mask.nonzero()
+        if len(rows):
+            xs, ys, types = roll_meteors(self.rng, len(rows), top, self.rules)
+            self.meteor_x[rows, cols] = xs
+            self.meteor_y[rows, cols] = ys
+            self.meteor_type[rows, cols] = types
+
+    def _fire(self, shoot):
+        """Ocupa as primeiras vagas livres com 1 míssil (ou 3 com upgrade)"""
+        count = np.where(self.weapon, 3, 1) * shoot
+        # Ordenação estável pelo flag de vivo: as vagas livres vêm primeiro
+        free_slots = np.argsort(self.missile_alive, axis=1, kind="stable")[:, :3]
+        free = ~np.take_along_axis(self.missile_alive, free_slots, axis=1)
+        for j, offset in enumerate(MISSILE_OFFSETS):
+            rows = ((count > j) & free[:, j]).nonzero()[0]
+            slots = free_slots[rows, j]
+            self.missile_x[rows, slots] = self.player_x[rows] + offset
+            self.missile_y[rows, slots] = self.player_y[rows] - MISSILE_H
+            self.missile_alive[rows, slots] = True
+
+    def step(self, actions):
+        """Avança todas as partidas um tick.
+
+        actions é (K,) com máscaras INPUT_* ou (K, 5) com esquerda, direita,
+        cima, baixo e tiro. Devolve (observação, recompensa, terminou); a
+        recompensa é o ganho de pontos no tick. Com auto_reset, a observação
+        de uma partida que terminou já é a da partida nova; sem ele, a partida
+        fica congelada no estado do game over até reset(). Os três arrays
+        são novos a cada chamada e podem ser guardados numa trajetória."""
+        rules = self.rules
+        actions = np.asarray(actions)
+        inputs = actions if actions.ndim == 1 else (actions.astype(bool) * ACTION_BITS).sum(axis=1)
+        was_done = self.done.copy()
+        live = ~was_done
+        inputs = inputs * live  # Partidas terminadas não se movem nem atiram
+        score_before = self.score.copy()
+        self.time += BASE_TICK_MS * live
+
+        # Nave: cada direção testa a borda com a posição já atualizada
+        speed = rules.player_speed
+        px, py = self.player_x, self.player_y
+        px -= speed * (((inputs & INPUT_LEFT) != 0) & (px > 0))
+        px += speed * (((inputs & INPUT_RIGHT) != 0) & (px + PLAYER_W < WIDTH))
+        py -= speed * (((inputs & INPUT_UP) != 0) & (py > 0))
+        py += speed * (((inputs & INPUT_DOWN) != 0) & (py + PLAYER_H < HEIGHT))
+
+        # Disparo
+        self.weapon &= ~(self.time > self.weapon_until)
+        cooldown = np.where(self.weapon, rules.fire_cooldown // 2, rules.fire_cooldown)
+        shoot = ((inputs & INPUT_FIRE) != 0) & (self.time - self.last_shot > cooldown)
+        if shoot.any():
+            self.last_shot[shoot] = self.time[shoot]
+            self._fire(shoot)
+
+        # Mísseis sobem; quem saiu por cima é liberado
+        self.missile_y -= rules.missile_speed
+        self.missile_alive &= self.missile_y + MISSILE_H >= 0
+
+        # Míssil x meteoro: só os mísseis vivos, cada um contra os meteoros
+        # da sua partida, com o critério do colliderect
+        games, slots = self.missile_alive.nonzero()
+        if len(games):
+            mx = self.missile_x[games, slots][:, None]
+            my = self.missile_y[games, slots][:, None]
+            ex, ey = self.meteor_x[games], self.meteor_y[games]
+            overlap = ((mx < ex + METEOR_W) & (ex < mx + MISSILE_W)
+                       & (my < ey + METEOR_H) & (ey < my + MISSILE_H))
+            hits = overlap.any(axis=1).nonzero()[0]
+            if len(hits):
+                # Cada míssil fica com o primeiro meteoro que sobrepõe; um meteoro
+                # disputado vai para o primeiro míssil (nonzero vem ordenado)
+                keys = games[hits] * self.num_meteors + overlap[hits].argmax(axis=1)
+                keys, first = np.unique(keys, return_index=True)
+                winners = hits[first]
+                self.missile_alive[games[winners], slots[winners]] = False
+                destroyed = np.zeros(self.meteor_type.shape, dtype=bool)
+                destroyed.flat[keys] = True
+                points = np.where(self.meteor_type == METEOR_TYPE_NORMAL, 5, 10)
+                self.score += (points * destroyed).sum(axis=1)
+                self._respawn(destroyed, -300)
+
+        # Meteoros descem; cada normal que sai pela parte de baixo vale 1 ponto
+        self.meteor_y += rules.meteor_speed * live[:, None]
+        normal = self.meteor_type == METEOR_TYPE_NORMAL
+        gone = (self.meteor_y > HEIGHT) & live[:, None]
+        self.score += (gone & normal).sum(axis=1)
+
+        # Meteoro x nave
+        hit = ((self.meteor_x < px[:, None] + PLAYER_W) & (self.meteor_x + METEOR_W > px[:, None])
+               & (self.meteor_y < py[:, None] + PLAYER_H) & (self.meteor_y + METEOR_H > py[:, None])
+               & live[:, None])
+        normal_hits = (hit & normal).sum(axis=1)
+        absorbed = np.minimum(self.shield, normal_hits)
+        self.shield -= absorbed
+        self.lives -= normal_hits - absorbed
+        finished = self.lives <= 0
+        self.lives += (hit & (self.meteor_type == METEOR_TYPE_BONUS)).sum(axis=1)
+
+        # Power-up: escudo ou arma, meio a meio
+        powerup = hit & (self.meteor_type == METEOR_TYPE_POWERUP)
+        if powerup.any():
+            roll_shield = self.rng.random(powerup.shape) < 0.5
+            self.shield = np.minimum(self.shield + 2 * (powerup & roll_shield).sum(axis=1), MAX_SHIELD)
+            upgraded = (powerup & ~roll_shield).any(axis=1)
+            self.weapon |= upgraded
+            self.weapon_until[upgraded] = self.time[upgraded] + rules.weapon_upgrade_duration
+
+        self._respawn(gone | hit, -100)
+
+        reward = self.score - score_before
+        done = finished | was_done
+        self.done = done.copy()
+        if done.any():
+            ended = finished & live
+            self.games_finished += int(np.count_nonzero(ended))
+            self.finished_scores.extend(self.score[ended].tolist())
+            # Os mísseis de quem acabou de perder somem: nada mais pontua ali
+            self.missile_alive[ended] = False
+            if self.auto_reset:
+                return self.reset(done), reward, done
+        return self._observe().copy(), reward, done
+
+
+# ----------------------------------------------------------
+# MODO HEADLESS EM LOTE
+# ----------------------------------------------------------
+POLICY_CHOICES = np.array([0, INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN]) | INPUT_FIRE
+
+
+def random_actions(rng, inputs):
+    """A random_policy do núcleo para K partidas: cada uma troca de
+    direção com chance de 10% por tick, sempre atirando"""
+    change = rng.random(len(inputs)) < 0.1
+    inputs[change] = rng.choice(POLICY_CHOICES, size=int(np.count_nonzero(change)))
+    return inputs
+
+
+def run_batch(num_games, ticks, seed=None, rules=None):
+    """Roda `ticks` ticks de `num_games` partidas em lote, reiniciando cada
+    partida no game over. Devolve um dicionário como o de run_headless."""
+    env = BatchEnv(num_games, seed=seed, rules=rules)
+    rng = np.random.default_rng(seed)
+    inputs = np.full(num_games, INPUT_FIRE)
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        env.step(random_actions(rng, inputs))
+    elapsed = time.perf_counter() - start
+
+    game_ticks = ticks * num_games
+    return {
+        "games": num_games,
+        "ticks": ticks,
+        "seconds": elapsed,
+        "game_ticks_per_second": game_ticks / elapsed if elapsed > 0 else float("inf"),
+        "scores": env.finished_scores,
+    }
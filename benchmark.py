@@ -0,0 +1,236 @@
+##############################################################
+###      S P A C E   E S C A P E  -  B E N C H M A R K     ###
+##############################################################
+### Cenários roteirizados rodando o núcleo e o desenho com ###
+### o driver de vídeo dummy do SDL: ticks por segundo,     ###
+### percentis do tempo de quadro e alocação por tick,      ###
+### comparados com um baseline em JSON. Uma regressão     ###
+### acima da tolerância faz o comando falhar.              ###
+##############################################################
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from assetManager import AssetManager
+from dirtyRenderer import DirtyRenderer
+from gameCore import (
+    WIDTH, HEIGHT, BASE_TICK_MS, MAX_SHIELD, INPUT_LEFT, INPUT_RIGHT, INPUT_FIRE,
+    GameRules, GameState, step,
+)
+from spaceScape import GameSprites, draw_game
+
+BASELINE_FILE = "benchmark_baseline.json"
+BENCH_SEED = 1234
+BENCH_TICKS = 600  # 10 s de jogo por cenário
+WARMUP_TICKS = 60
+ALLOC_TICKS = 60  # Ticks medidos com tracemalloc (bem mais lentos)
+TOLERANCE = 0.15
+
+SCENARIOS = {
+    "padrao": {"meteors": 5},
+    "meteoros_100": {"meteors": 100},
+    "meteoros_1000": {"meteors": 1000},
+    "meteoros_10000": {"meteors": 10000, "ticks": 180},  # Cada quadro custa ~100 ms
+    "tiro_triplo": {"meteors": 5, "triple_shot": True},
+    "escudo": {"meteors": 5, "shield": True},
+}
+
+# Métrica -> (maior é melhor?, variação absoluta ignorada). A folga
+# absoluta evita acusar ruído em números pequenos (quadros de 0,2 ms)
+METRICS = {
+    "ticks_per_second": (True, 0.0),
+    "frame_p95_ms": (False, 0.1),
+    "alloc_kb_per_tick": (False, 0.5),
+}
+
+
+def scripted_inputs(tick):
+    """Atira sempre e varre a tela de um lado para o outro"""
+    return INPUT_FIRE | (INPUT_LEFT if (tick // 90) % 2 else INPUT_RIGHT)
+
+
+class Scenario:
+    """Uma partida preparada para ficar no mesmo regime durante a medição"""
+
+    def __init__(self, name, meteors, triple_shot=False, shield=False, masks=None):
+        self.name = name
+        self.triple_shot = triple_shot
+        self.shield = shield
+        # Vidas de sobra: o cenário nunca chega ao game over
+        self.state = GameState(seed=BENCH_SEED, rules=GameRules(initial_meteors=meteors, initial_lives=10 ** 9))
+        self.masks = masks
+        self.ticks = 0
+
+    def tick(self):
+        state = self.state
+        if self.triple_shot:
+            state.player_weapon_upgrade = True
+            state.weapon_upgrade_time = float("inf")
+        if self.shield:
+            state.player_shield = MAX_SHIELD
+        step(state, scripted_inputs(self.ticks), BASE_TICK_MS, self.masks)
+        self.ticks += 1
+
+
+def frame(scenario, renderer, sprites):
+    """Um quadro como no loop do jogo: um tick e o desenho"""
+    scenario.tick()
+    if renderer:
+        renderer.begin()
+        draw_game(renderer, scenario.state, sprites, 0.0)
+        renderer.end()
+
+
+def run_scenario(name, ticks=None, renderer=None, sprites=None):
+    config = dict(SCENARIOS[name])
+    scenario_ticks = config.pop("ticks", BENCH_TICKS)
+    ticks = scenario_ticks if ticks is None else ticks
+    # Com sprites a colisão é por pixel, como no jogo
+    masks = sprites.collision_masks() if sprites else None
+    scenario = Scenario(name, masks=masks, **config)
+    for _ in range(WARMUP_TICKS):
+        frame(scenario, renderer, sprites)
+
+    # Tempo do núcleo e do quadro inteiro, tick a tick
+    step_ns = np.empty(ticks, dtype=np.int64)
+    frame_ns = np.empty(ticks, dtype=np.int64)
+    state = scenario.state
+    if masks:
+        masks.end_frame()  # Os testes do aquecimento ficam fora da conta
+    tests_before = masks.total_tests if masks else 0
+    for i in range(ticks):
+        start = time.perf_counter_ns()
+        scenario.tick()
+        after_step = time.perf_counter_ns()
+        if renderer:
+            renderer.begin()
+            draw_game(renderer, state, sprites, 0.0)
+            renderer.end()
+        end = time.perf_counter_ns()
+        step_ns[i] = after_step - start
+        frame_ns[i] = end - start
+        if masks:
+            masks.end_frame()
+    mask_tests = (masks.total_tests - tests_before) if masks else 0
+
+    # Alocação: pico de memória Python acima do nível de antes de cada quadro
+    tracemalloc.start()
+    transient = 0
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(ALLOC_TICKS):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        frame(scenario, renderer, sprites)
+        transient += tracemalloc.get_traced_memory()[1] - before
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(frame_ns, (50, 95, 99)) / 1e6
+    return {
+        "ticks": ticks,
+        "ticks_per_second": ticks / (step_ns.sum() / 1e9),
+        "frame_p50_ms": p50,
+        "frame_p95_ms": p95,
+        "frame_p99_ms": p99,
+        "alloc_kb_per_tick": transient / ALLOC_TICKS / 1024,
+        "blocks_per_tick": (blocks_after - blocks_before) / ALLOC_TICKS,
+        "mask_tests_per_tick": mask_tests / ticks,
+        "meteors": int(np.count_nonzero(state.meteors.alive[:state.meteors.size])),
+    }
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Lista de regressões (cenário, métrica, baseline, atual)"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric, (higher_is_better, slack) in METRICS.items():
+            if metric not in base:
+                continue
+            old, new = base[metric], result[metric]
+            if higher_is_better:
+                worse = new < old * (1 - tolerance) - slack
+            else:
+                worse = new > old * (1 + tolerance) + slack
+            if worse:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark do Space Escape",
+        epilog=f"o baseline depende da máquina e não vem no repositório: rode uma vez com "
+               f"--save-baseline (grava {BASELINE_FILE}) antes de usar a comparação")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        help="cenários separados por vírgula (padrão: todos)")
+    parser.add_argument("--ticks", type=int, default=None,
+                        help=f"ticks medidos por cenário (padrão: {BENCH_TICKS}, menos nos cenários pesados)")
+    parser.add_argument("--no-render", action="store_true", help="mede só o núcleo, sem desenhar")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="arquivo JSON do baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="grava os resultados como novo baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="piora aceita (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenários desconhecidos: {', '.join(unknown)}")
+
+    renderer = sprites = None
+    if not args.no_render:
+        pygame.display.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        sprites = GameSprites(AssetManager())
+        renderer = DirtyRenderer(screen, sprites.background)
+
+    results = {}
+    print(f"{'cenário':<16}{'meteoros':>9}{'ticks/s':>10}{'p50 ms':>8}{'p95 ms':>8}{'p99 ms':>8}"
+          f"{'KB/tick':>9}{'blocos':>8}{'máscaras':>10}")
+    for name in names:
+        result = results[name] = run_scenario(name, args.ticks, renderer, sprites)
+        print(f"{name:<16}{result['meteors']:>9}{result['ticks_per_second']:>10.0f}"
+              f"{result['frame_p50_ms']:>8.2f}{result['frame_p95_ms']:>8.2f}{result['frame_p99_ms']:>8.2f}"
+              f"{result['alloc_kb_per_tick']:>9.1f}{result['blocks_per_tick']:>8.1f}"
+              f"{result['mask_tests_per_tick']:>10.2f}")
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r') as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=4)
+        print(f"✓ Baseline gravado em {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"  Sem baseline em {args.baseline}; use --save-baseline para criar um")
+        return 0
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, metric, old, new in regressions:
+        print(f"✗ REGRESSÃO em {name}: {metric} {old:.2f} → {new:.2f}")
+    if regressions:
+        return 1
+    print(f"✓ Nenhuma regressão acima de {args.tolerance:.0%} em relação a {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+##############################################################
+###         S P A C E   E S C A P E  -  M Á S C A R A S    ###
+##############################################################
+### Colisão por pixel: a máscara de cada sprite é feita    ###
+### uma vez por tamanho e guardada. O núcleo continua      ###
+### testando retângulos primeiro; só os pares que se       ###
+### sobrepõem chegam ao teste de máscara, que é contado    ###
+### por quadro para conferir que a fase fina fica barata.  ###
+##############################################################
+
+import pygame
+
+ALPHA_THRESHOLD = 127  # Pixels mais transparentes que isso não colidem
+
+
+class CollisionMasks:
+    """Máscaras por nome de sprite e tamanho, com contagem de testes"""
+
+    def __init__(self, threshold=ALPHA_THRESHOLD):
+        self.threshold = threshold
+        self.sources = {}  # Nome -> máscara no tamanho original do sprite
+        self.masks = {}  # (nome, tamanho) -> máscara
+
+        self.tests = 0  # Testes de máscara no quadro atual
+        self.hits = 0
+        self.last_frame_tests = 0
+        self.max_frame_tests = 0
+        self.total_tests = 0
+        self.frames = 0
+
+    def add(self, name, surface):
+        """Registra o sprite `name`; a máscara sai do canal alfa (ou do colorkey)"""
+        mask = pygame.mask.from_surface(surface, self.threshold)
+        self.sources[name] = mask
+        self.masks[(name, surface.get_size())] = mask
+
+    def get(self, name, size):
+        """Máscara de `name` em `size`; outros tamanhos são escalados uma vez"""
+        mask = self.masks.get((name, size))
+        if mask is None:
+            mask = self.masks[(name, size)] = self.sources[name].scale(size)
+        return mask
+
+    def overlap(self, name_a, rect_a, name_b, rect_b):
+        """Os pixels opacos dos dois sprites se tocam? Só para pares cujos
+        retângulos já se sobrepõem"""
+        self.tests += 1
+        offset = (rect_b.x - rect_a.x, rect_b.y - rect_a.y)
+        if self.get(name_a, rect_a.size).overlap(self.get(name_b, rect_b.size), offset) is None:
+            return False
+        self.hits += 1
+        return True
+
+    def end_frame(self):
+        """Fecha a contagem do quadro"""
+        self.last_frame_tests = self.tests
+        self.max_frame_tests = max(self.max_frame_tests, self.tests)
+        self.total_tests += self.tests
+        self.frames += 1
+        self.tests = 0
+
+    def report(self):
+        if not self.frames:
+            return "Máscaras: nenhum quadro"
+        return (f"Máscaras: {self.total_tests} testes ({self.total_tests / self.frames:.2f} por quadro, "
+                f"máximo {self.max_frame_tests}), "
+                f"{self.hits} colisões confirmadas, {len(self.masks)} máscaras em cache")
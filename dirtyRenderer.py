@@ -0,0 +1,103 @@
+##############################################################
+###        S P A C E   E S C A P E  -  R E N D E R         ###
+##############################################################
+### Em vez de redesenhar o fundo inteiro e dar flip a cada ###
+### quadro, guarda os retângulos desenhados, apaga só eles ###
+### no quadro seguinte e envia à tela apenas o que mudou.  ###
+### Se a área suja passar de um limite, volta ao flip.     ###
+### Os blits do quadro são enfileirados e enviados juntos  ###
+### num único Surface.blits.                               ###
+##############################################################
+
+import pygame
+
+FULL_REDRAW_THRESHOLD = 0.35  # Fração da tela acima da qual um flip sai mais barato
+
+
+class DirtyRenderer:
+    """Desenha sobre um fundo fixo atualizando só as regiões que mudaram"""
+
+    def __init__(self, screen, background, threshold=FULL_REDRAW_THRESHOLD, enabled=True):
+        self.screen = screen
+        self.background = background
+        self.enabled = enabled
+        self.screen_area = screen.get_width() * screen.get_height()
+        self.threshold_area = threshold * self.screen_area
+
+        self.previous = []  # Retângulos desenhados no quadro anterior
+        self.current = []
+        self.batch = []  # (surface, posição) ainda não enviados
+        self.full_redraw = True  # O primeiro quadro sempre desenha a tela inteira
+
+        # Estatísticas para comparar com o flip de tela cheia
+        self.frames = 0
+        self.full_frames = 0
+        self.pixels = 0
+        self.blits = 0
+        self.batches = 0
+
+    def invalidate(self):
+        """Força um quadro completo (ex.: depois de outra tela ter usado a janela)"""
+        self.full_redraw = True
+
+    def begin(self):
+        """Apaga o que foi desenhado no quadro anterior"""
+        if self.full_redraw or not self.enabled:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            background = self.background
+            self.screen.blits([(background, rect, rect) for rect in self.previous], False)
+        self.current = []
+
+    def draw(self, surface, pos):
+        """Enfileira um blit; a ordem de chegada é a ordem de desenho"""
+        self.batch.append((surface, pos))
+
+    def draw_many(self, pairs):
+        """Enfileira vários (surface, posição) de uma vez"""
+        self.batch.extend(pairs)
+
+    def flush(self):
+        """Desenha a fila num único Surface.blits e registra as áreas afetadas.
+        Precisa ser chamado antes de desenhar algo por fora da fila."""
+        if not self.batch:
+            return
+        # Retângulos vazios (sprites fora da tela) não atrapalham o update
+        self.current.extend(self.screen.blits(self.batch))
+        self.blits += len(self.batch)
+        self.batches += 1
+        self.batch = []
+
+    def mark(self, rect):
+        """Registra uma área desenhada por fora da fila (HUD)"""
+        rect = rect.clip(self.screen.get_rect())
+        if rect.width and rect.height:
+            self.current.append(rect)
+
+    def end(self):
+        """Envia o quadro para a janela e devolve a área atualizada em pixels"""
+        self.flush()
+        dirty = self.previous + self.current
+        self.previous = self.current
+        self.frames += 1
+
+        area = 0
+        if not self.full_redraw and self.enabled:
+            for rect in dirty:
+                area += rect.width * rect.height
+        if self.full_redraw or not self.enabled or area > self.threshold_area:
+            pygame.display.flip()
+            self.full_redraw = False
+            self.full_frames += 1
+            area = self.screen_area
+        else:
+            pygame.display.update(dirty)
+        self.pixels += area
+        return area
+
+    def report(self):
+        mean = self.pixels / self.frames / self.screen_area * 100 if self.frames else 0.0
+        per_frame = self.blits / self.frames if self.frames else 0.0
+        return (f"Render: {self.frames} quadros, {self.full_frames} completos, "
+                f"{mean:.1f}% da tela enviada por quadro em média, "
+                f"{per_frame:.1f} blits por quadro em {self.batches} lotes")
@@ -0,0 +1,48 @@
+##############################################################
+###        S P A C E   E S C A P E  -  E F E I T O S       ###
+##############################################################
+### Superfícies de efeitos (anel do escudo, quadros da     ###
+### explosão, marcações dos meteoros) desenhadas uma vez   ###
+### por combinação de parâmetros e reaproveitadas, para o  ###
+### quadro normal do jogo não alocar nenhuma Surface.      ###
+##############################################################
+
+
+class EffectCache:
+    """Registro de efeitos: build(*params) desenha a Surface na primeira vez"""
+
+    def __init__(self):
+        self.builders = {}
+        self.surfaces = {}
+        self.frame_counts = {}
+        self.builds = 0  # Surfaces criadas desde o início
+
+    def register(self, name, build, frames=None):
+        """Registra um efeito; `frames` indica um efeito animado, cujo
+        primeiro parâmetro é o índice do quadro (0 .. frames - 1)"""
+        self.builders[name] = build
+        if frames is not None:
+            self.frame_counts[name] = frames
+
+    def get(self, name, *params):
+        key = (name,) + params
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = self.builders[name](*params)
+            self.builds += 1
+        return surface
+
+    def frame(self, name, progress, *params):
+        """Quadro de um efeito animado para `progress` entre 0 e 1"""
+        count = self.frame_counts[name]
+        index = min(count - 1, max(0, int(progress * count)))
+        return self.get(name, index, *params)
+
+    def prebuild(self, name, params_list):
+        """Desenha de antemão as variantes já conhecidas (ex.: na inicialização)"""
+        for params in params_list:
+            self.get(name, *params)
+
+    def prebuild_frames(self, name, *params):
+        for index in range(self.frame_counts[name]):
+            self.get(name, index, *params)
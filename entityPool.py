@@ -0,0 +1,64 @@
+##############################################################
+###          S P A C E   E S C A P E  -  P O O L S         ###
+##############################################################
+### Pools de entidades com Rects pré-alocados. As ativas   ###
+### ficam em rects[0:count] e o resto é a lista livre;     ###
+### remover troca com a última ativa, em O(1), sem criar   ###
+### Rect novo nem copiar a lista para iterar.              ###
+##############################################################
+
+import pygame
+
+
+class EntityPool:
+    """Pool de capacidade fixa de Rects de um mesmo tamanho.
+
+    Para remover durante a iteração, percorra de trás para frente
+    (range(count - 1, -1, -1)): a entidade trazida do fim para o lugar
+    da removida já foi visitada.
+    """
+
+    def __init__(self, capacity, size):
+        self.size = size
+        self.rects = [pygame.Rect((0, 0), size) for _ in range(capacity)]
+        self.values = [0] * capacity  # Um valor por entidade (ex.: início da explosão)
+        self.count = 0
+        self.allocated = capacity  # Rects criados até agora; só muda se o pool crescer
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        rects = self.rects
+        for i in range(self.count):
+            yield rects[i]
+
+    def _grow(self):
+        extra = len(self.rects)
+        self.rects.extend(pygame.Rect((0, 0), self.size) for _ in range(extra))
+        self.values.extend([0] * extra)
+        self.allocated += extra
+
+    def acquire(self, x, y, value=0):
+        """Ativa uma entidade na posição (x, y) e devolve o Rect dela"""
+        if self.count == len(self.rects):
+            self._grow()
+        rect = self.rects[self.count]
+        rect.x = x
+        rect.y = y
+        self.values[self.count] = value
+        self.count += 1
+        return rect
+
+    def release(self, i):
+        """Desativa a entidade i trocando-a com a última ativa"""
+        last = self.count - 1
+        if i != last:
+            rects = self.rects
+            values = self.values
+            rects[i], rects[last] = rects[last], rects[i]
+            values[i], values[last] = values[last], values[i]
+        self.count = last
+
+    def clear(self):
+        self.count = 0
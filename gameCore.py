@@ -0,0 +1,423 @@
+##############################################################
+###          S P A C E   E S C A P E  -  N Ú C L E O       ###
+##############################################################
+### Estado do jogo e regras da simulação, sem janela, sem  ###
+### relógio e sem som. O spaceScape.py é só uma das telas  ###
+### que consomem este módulo; o modo headless é outra.     ###
+##############################################################
+
+import random
+import time
+
+import numpy as np
+import pygame
+
+from entityPool import EntityPool
+from meteorField import MeteorField
+from spatialHash import SpatialHash
+
+# ----------------------------------------------------------
+# CONFIGURAÇÕES
+# ----------------------------------------------------------
+WIDTH, HEIGHT = 800, 600
+FPS = 60
+TICK_RATE = 60  # Ticks de simulação por segundo
+BASE_TICK_MS = 1000 / 60  # As velocidades das regras são em pixels por tick de 60 Hz
+
+PLAYER_SIZE = (80, 60)
+METEOR_SIZE = (40, 40)
+MISSILE_SIZE = (6, 20)
+EXPLOSION_SIZE = (60, 60)
+
+METEOR_TYPE_NORMAL = 0
+METEOR_TYPE_BONUS = 1
+METEOR_TYPE_POWERUP = 2  # Meteoro especial que adiciona capacidades
+
+# Sistema de power-ups da nave
+POWERUP_TYPE_SHIELD = 0
+POWERUP_TYPE_WEAPON = 1
+MAX_SHIELD = 3  # Cada power-up de escudo dá 2, até esse máximo
+
+WEAPON_UPGRADE_DURATION = 15000  # 15 segundos
+FIRE_COOLDOWN = 300
+EXPLOSION_DURATION = 200
+CONDICAO_VITORIA = 500
+SPAWN_ROLL = 20  # Chances de tipo dos meteoros são em vinte avos
+
+# Entradas de um tick, como máscara de bits
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_UP = 4
+INPUT_DOWN = 8
+INPUT_FIRE = 16
+
+# Nome da máscara de colisão de cada sprite, por tipo de meteoro
+MASK_PLAYER = "player"
+MASK_MISSILE = "missile"
+METEOR_MASKS = ("meteor", "meteor_bonus", "meteor_powerup")
+
+# Fases de step(), na numeração das fases do quadro do profiler
+PHASE_PLAYER = 2
+PHASE_MISSILES = 3
+PHASE_METEORS = 4
+PHASE_EXPLOSIONS = 5
+
+# Eventos devolvidos por step() para quem quiser tocar sons
+EVENT_POINT = "point"
+EVENT_HIT = "hit"
+
+
+class GameRules:
+    """Constantes de balanceamento de uma partida (velocidades em px por tick de 60 Hz)"""
+
+    def __init__(self, player_speed=7, meteor_speed=5, missile_speed=10,
+                 fire_cooldown=FIRE_COOLDOWN,
+                 weapon_upgrade_duration=WEAPON_UPGRADE_DURATION,
+                 explosion_duration=EXPLOSION_DURATION,
+                 initial_meteors=5, initial_lives=3, powerup_odds=1, bonus_odds=2):
+        self.player_speed = player_speed
+        self.meteor_speed = meteor_speed
+        self.missile_speed = missile_speed
+        self.fire_cooldown = fire_cooldown
+        self.weapon_upgrade_duration = weapon_upgrade_duration
+        self.explosion_duration = explosion_duration
+        self.initial_meteors = initial_meteors
+        self.initial_lives = initial_lives
+        self.powerup_odds = powerup_odds  # Em SPAWN_ROLL
+        self.bonus_odds = bonus_odds
+
+
+class GameState:
+    """Tudo o que muda durante uma partida"""
+
+    def __init__(self, seed=None, rules=None):
+        self.rules = rules or GameRules()
+        if seed is None:
+            seed = random.randrange(2 ** 32)  # Sempre há uma semente, para gravar replays
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
+
+        self.player_rect = pygame.Rect((0, 0), PLAYER_SIZE)
+        self.player_rect.center = (WIDTH // 2, HEIGHT - 60)
+
+        self.meteors = MeteorField(max(16, self.rules.initial_meteors))
+        self.meteor_grid = SpatialHash()
+        self.meteor_scratch = pygame.Rect(0, 0, 0, 0)  # Rect reaproveitado nos testes
+        xs, ys, types = roll_meteors(self.np_rng, self.rules.initial_meteors, -500, self.rules)
+        for x, y, meteor_type in zip(xs.tolist(), ys.tolist(), types.tolist()):
+            self.meteors.add(x, y, meteor_type)
+        rebuild_meteor_grid(self)
+
+        self.missiles = EntityPool(64, MISSILE_SIZE)
+        self.explosions = EntityPool(32, EXPLOSION_SIZE)  # values = instante de início
+
+        self.score = 0
+        self.lives = self.rules.initial_lives
+        self.player_shield = 0  # Número de escudos ativos (0 a MAX_SHIELD)
+        self.player_weapon_upgrade = False  # Arma melhorada ativa
+        self.weapon_upgrade_time = 0  # Instante em que o upgrade de arma acaba
+        self.last_shot_time = 0
+
+        self.time = 0  # Relógio da simulação em ms
+        self.ticks = 0
+        self.running = True
+
+        # Frações de pixel acumuladas quando o tick não é de 60 Hz
+        self.player_carry = 0.0
+        self.meteor_carry = 0.0
+        self.missile_carry = 0.0
+
+        # Deslocamentos do último tick, usados pela tela para interpolar
+        self.prev_player_pos = self.player_rect.topleft
+        self.meteor_dy = 0
+        self.missile_dy = 0
+
+
+def roll_meteors(np_rng, count, top, rules=None):
+    """Sorteia `count` meteoros acima da tela, entre y=top e y=-40.
+    Tipos: power-up e bônus com as chances das regras (1/20 e 2/20 por
+    padrão), o resto normal."""
+    powerup_odds, bonus_odds = (rules.powerup_odds, rules.bonus_odds) if rules else (1, 2)
+    rand = np_rng.integers(1, SPAWN_ROLL + 1, size=count)
+    types = np.where(rand <= powerup_odds, METEOR_TYPE_POWERUP,
+                     np.where(rand <= powerup_odds + bonus_odds, METEOR_TYPE_BONUS, METEOR_TYPE_NORMAL))
+    xs = np_rng.integers(0, WIDTH - 40 + 1, size=count)
+    ys = np_rng.integers(top, -40 + 1, size=count)
+    return xs, ys, types
+
+
+def meteor_rect(meteors, i, rect):
+    """Copia para rect a caixa do meteoro i (sem alocar Rect novo)"""
+    rect.update(int(meteors.x[i]), int(meteors.y[i]), int(meteors.w[i]), int(meteors.h[i]))
+    return rect
+
+
+def rebuild_meteor_grid(state):
+    meteors = state.meteors
+    scratch = state.meteor_scratch
+    alive = np.flatnonzero(meteors.alive[:meteors.size]).tolist()
+    state.meteor_grid.rebuild((i, meteor_rect(meteors, i, scratch)) for i in alive)
+
+
+def respawn_meteors(state, slots, top):
+    """Faz renascer, nos mesmos slots, os meteoros que saíram ou foram destruídos"""
+    meteors = state.meteors
+    grid = state.meteor_grid
+    xs, ys, types = roll_meteors(state.np_rng, len(slots), top, state.rules)
+    meteors.respawn(slots, xs, ys, types)
+    for i in np.asarray(slots).tolist():
+        grid.remove(i)
+        grid.insert(i, meteor_rect(meteors, i, state.meteor_scratch))
+
+
+def apply_saved_state(state, saved_state):
+    """Restaura num GameState o dicionário devolvido por load_game()"""
+    state.score = saved_state["score"]
+    state.lives = saved_state["lives"]
+    state.player_rect.x = saved_state["player_x"]
+    state.player_rect.y = saved_state["player_y"]
+
+    # Restaurar power-ups
+    state.player_shield = saved_state.get("shield", 0)
+    state.player_weapon_upgrade = saved_state.get("weapon_upgrade", False)
+    state.weapon_upgrade_time = saved_state.get("weapon_upgrade_time", 0)
+
+    # Reconstruir campo de meteoros
+    state.meteors.clear()
+    for meteor_data in saved_state["meteors"]:
+        meteor_type = meteor_data.get("type", METEOR_TYPE_NORMAL)
+        state.meteors.add(meteor_data["x"], meteor_data["y"], meteor_type)
+    rebuild_meteor_grid(state)
+
+
+# ----------------------------------------------------------
+# PASSO DA SIMULAÇÃO
+# ----------------------------------------------------------
+def tick_ms(tick_rate=TICK_RATE):
+    return 1000 / tick_rate
+
+
+def _travel(carry, speed, scale):
+    """Deslocamento inteiro deste tick e a fração que sobra para o próximo"""
+    carry += speed * scale
+    whole = int(carry)
+    return whole, carry - whole
+
+
+def step(state, inputs, dt, masks=None, profiler=None):
+    """Avança a partida um tick de dt ms.
+
+    inputs é uma máscara INPUT_*. dt avança o relógio usado por cooldowns
+    e timers e escala as velocidades (a 60 Hz cada tick anda exatamente a
+    velocidade das regras). Devolve a lista de eventos (EVENT_*) do tick.
+
+    Opcionais, vindos de quem tem sprites e relógio: masks (com overlap(),
+    como CollisionMasks) liga a colisão por pixel depois do teste de
+    retângulos; profiler recebe mark(PHASE_*) no fim de cada fase.
+    """
+    rules = state.rules
+    events = []
+    state.time += dt
+    state.ticks += 1
+    current_time = state.time
+    scale = dt / BASE_TICK_MS
+    player_rect = state.player_rect
+    state.prev_player_pos = player_rect.topleft
+    player_speed, state.player_carry = _travel(state.player_carry, rules.player_speed, scale)
+
+    if inputs & INPUT_LEFT and player_rect.left > 0:
+        player_rect.x -= player_speed
+    if inputs & INPUT_RIGHT and player_rect.right < WIDTH:
+        player_rect.x += player_speed
+    if inputs & INPUT_UP and player_rect.top > 0:
+        player_rect.y -= player_speed
+    if inputs & INPUT_DOWN and player_rect.bottom < HEIGHT:
+        player_rect.y += player_speed
+
+    # ------------------------------------------------------
+    # DISPARO
+    # ------------------------------------------------------
+    # Atualizar duração do upgrade de arma
+    if state.player_weapon_upgrade and current_time > state.weapon_upgrade_time:
+        state.player_weapon_upgrade = False
+
+    # Cooldown reduzido se tiver upgrade de arma
+    fire_cooldown = rules.fire_cooldown // 2 if state.player_weapon_upgrade else rules.fire_cooldown
+
+    if inputs & INPUT_FIRE and current_time - state.last_shot_time > fire_cooldown:
+        state.last_shot_time = current_time
+
+        if state.player_weapon_upgrade:
+            # Disparo triplo quando tem upgrade de arma
+            state.missiles.acquire(player_rect.centerx - 3, player_rect.top - 20)
+            state.missiles.acquire(player_rect.left + 10, player_rect.top - 20)
+            state.missiles.acquire(player_rect.right - 16, player_rect.top - 20)
+        else:
+            # Disparo normal
+            state.missiles.acquire(player_rect.centerx - 3, player_rect.top - 20)
+
+    if profiler:
+        profiler.mark(PHASE_PLAYER)
+
+    # ------------------------------------------------------
+    # MÍSSEIS
+    # ------------------------------------------------------
+    missiles = state.missiles
+    missile_rects = missiles.rects
+    meteors = state.meteors
+    scratch = state.meteor_scratch
+    grid = state.meteor_grid
+    grid.reset_stats()
+    meteor_count = len(grid.items)
+    destroyed = []
+    missile_dy, state.missile_carry = _travel(state.missile_carry, rules.missile_speed, scale)
+    state.missile_dy = missile_dy
+
+    # De trás para frente: release() traz para o lugar a última ativa
+    for m in range(missiles.count - 1, -1, -1):
+        missile = missile_rects[m]
+        missile.y -= missile_dy
+
+        if missile.bottom < 0:
+            missiles.release(m)
+            continue
+
+        # Só os meteoros das células vizinhas chegam ao teste de retângulo
+        grid.naive_pairs += meteor_count
+        for i in grid.query(missile):
+            grid.pairs += 1
+            meteor_rect(meteors, i, scratch)
+
+            # Retângulo primeiro; a máscara só para quem passou
+            if missile.colliderect(scratch) and (
+                    masks is None or masks.overlap(MASK_MISSILE, missile, METEOR_MASKS[meteors.type[i]], scratch)):
+
+                missiles.release(m)
+
+                exp_rect = state.explosions.acquire(0, 0, current_time)
+                exp_rect.center = scratch.center
+
+                # Sai da grade já, para nenhum outro míssil acertá-lo neste tick
+                grid.remove(i)
+                destroyed.append(i)
+
+                state.score += 5 if meteors.type[i] == METEOR_TYPE_NORMAL else 10
+
+                break
+
+    if destroyed:
+        respawn_meteors(state, destroyed, -300)
+
+    if profiler:
+        profiler.mark(PHASE_MISSILES)
+
+    # ------------------------------------------------------
+    # METEOROS
+    # ------------------------------------------------------
+    meteor_dy, state.meteor_carry = _travel(state.meteor_carry, rules.meteor_speed, scale)
+    state.meteor_dy = meteor_dy
+    meteors.move(meteor_dy)
+    grid.shift(meteor_dy)
+
+    # Quem saiu pela parte de baixo da tela
+    gone = meteors.below(HEIGHT)
+    if len(gone):
+        normal = int(np.count_nonzero(meteors.type[gone] == METEOR_TYPE_NORMAL))
+        state.score += normal
+        events.extend([EVENT_POINT] * normal)
+
+    # Quem colidiu com a nave (quem saiu da tela nunca sobrepõe a nave)
+    hit = meteors.overlapping(player_rect)
+    if masks is not None and len(hit):
+        hit = hit[[masks.overlap(MASK_PLAYER, player_rect, METEOR_MASKS[meteors.type[i]],
+                                 meteor_rect(meteors, i, scratch)) for i in hit.tolist()]]
+    for meteor_type in meteors.type[hit].tolist():
+
+        if meteor_type == METEOR_TYPE_NORMAL:
+            # Verificar se tem escudo
+            if state.player_shield > 0:
+                state.player_shield -= 1
+                events.append(EVENT_POINT)
+            else:
+                state.lives -= 1
+                events.append(EVENT_HIT)
+        elif meteor_type == METEOR_TYPE_BONUS:
+            state.lives += 1
+            events.append(EVENT_POINT)
+        elif meteor_type == METEOR_TYPE_POWERUP:
+            # Aplicar power-up aleatório (escudo ou arma)
+            powerup_type = state.rng.choice([POWERUP_TYPE_SHIELD, POWERUP_TYPE_WEAPON])
+
+            if powerup_type == POWERUP_TYPE_SHIELD:
+                state.player_shield = min(state.player_shield + 2, MAX_SHIELD)  # Adiciona 2 escudos
+            elif powerup_type == POWERUP_TYPE_WEAPON:
+                state.player_weapon_upgrade = True
+                state.weapon_upgrade_time = current_time + rules.weapon_upgrade_duration
+
+            events.append(EVENT_POINT)
+
+        if state.lives <= 0:
+            state.running = False
+
+    # Os que saíram e os que bateram renascem de uma vez
+    if len(gone) or len(hit):
+        respawn_meteors(state, np.concatenate((gone, hit)), -100)
+
+    if profiler:
+        profiler.mark(PHASE_METEORS)
+
+    # ------------------------------------------------------
+    # EXPLOSÕES
+    # ------------------------------------------------------
+    explosions = state.explosions
+    started = explosions.values
+    for e in range(explosions.count - 1, -1, -1):
+        if current_time - started[e] > rules.explosion_duration:
+            explosions.release(e)
+
+    if profiler:
+        profiler.mark(PHASE_EXPLOSIONS)
+    return events
+
+
+# ----------------------------------------------------------
+# MODO HEADLESS
+# ----------------------------------------------------------
+def random_policy(rng):
+    """Política de teste: segura o tiro e muda de direção de vez em quando"""
+    inputs = INPUT_FIRE
+    while True:
+        if rng.random() < 0.1:
+            inputs = INPUT_FIRE | rng.choice([0, INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN])
+        yield inputs
+
+
+def run_headless(ticks, seed=None, rules=None, dt=BASE_TICK_MS):
+    """Roda `ticks` ticks sem tela nem relógio, reiniciando a partida a cada
+    game over. Devolve um dicionário com o desempenho e os resultados."""
+    rng = random.Random(seed)
+    policy = random_policy(rng)
+    state = GameState(seed=rng.randrange(2 ** 32), rules=rules)
+    scores = []
+    pairs = naive_pairs = 0
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        step(state, next(policy), dt)
+        pairs += state.meteor_grid.pairs
+        naive_pairs += state.meteor_grid.naive_pairs
+        if not state.running:
+            scores.append(state.score)
+            state = GameState(seed=rng.randrange(2 ** 32), rules=rules)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": ticks,
+        "seconds": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed > 0 else float("inf"),
+        "games": len(scores),
+        "scores": scores,
+        "collision_pairs": pairs,
+        "naive_collision_pairs": naive_pairs,
+    }
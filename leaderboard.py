@@ -0,0 +1,200 @@
+##############################################################
+###     S P A C E   E S C A P E  -  L E A D E R B O A R D  ###
+##############################################################
+### Todas as partidas num arquivo SQLite local, com índices ###
+### por pontuação, data e jogador. O recorde e a lista     ###
+### ordenada de pontos ficam em memória para o menu e para ###
+### o ranking em O(log n).                                 ###
+##############################################################
+
+import bisect
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+LEADERBOARD_FILE = "leaderboard.db"
+LEGACY_HIGH_SCORE_FILE = "high_score.json"
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"  # Formato gravado (ordena como texto)
+DISPLAY_DATE_FORMAT = "%d/%m/%Y %H:%M"
+
+EMPTY_HIGH_SCORE = {"score": 0, "name": "---", "date": "---"}
+LEGACY_IMPORTED = 1  # PRAGMA user_version depois que o high_score.json foi olhado
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    played_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC, id);
+CREATE INDEX IF NOT EXISTS idx_scores_played_at ON scores (played_at);
+CREATE INDEX IF NOT EXISTS idx_scores_name_score ON scores (name, score DESC, id);
+"""
+
+
+def _row_to_entry(row):
+    name, score, played_at = row
+    try:
+        date = datetime.strptime(played_at, DATE_FORMAT).strftime(DISPLAY_DATE_FORMAT)
+    except ValueError:
+        date = played_at
+    return {"name": name, "score": score, "date": date}
+
+
+class Leaderboard:
+    """Placar persistente com consultas indexadas e páginas"""
+
+    def __init__(self, path=LEADERBOARD_FILE, legacy_path=LEGACY_HIGH_SCORE_FILE, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval  # Segundos entre duas verificações do banco
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+        self.best_entry = None
+        self.sorted_scores = None  # Pontuações em ordem crescente, carregadas sob demanda
+        self.data_version = None
+        self.next_check = 0.0
+
+        # Contadores para conferir que o menu não consulta o banco a cada quadro
+        self.hits = 0
+        self.misses = 0
+
+        if legacy_path and self.conn.execute("PRAGMA user_version").fetchone()[0] < LEGACY_IMPORTED:
+            if self.count() == 0:
+                self._import_legacy(legacy_path)
+            # Tentada uma vez só, mesmo que não houvesse nada ou o arquivo estivesse ruim
+            self.conn.execute(f"PRAGMA user_version = {LEGACY_IMPORTED}")
+
+    def close(self):
+        self.conn.close()
+
+    def _import_legacy(self, legacy_path):
+        """Traz o recorde único do high_score.json antigo para o placar"""
+        if not os.path.exists(legacy_path):
+            return
+        try:
+            with open(legacy_path, 'r') as f:
+                legacy = json.load(f)
+            # O recorde vazio padrão (0 pontos, data "---") não é uma partida
+            if legacy.get("score", 0) <= 0:
+                return
+            date = legacy.get("date", EMPTY_HIGH_SCORE["date"])
+            played_at = None if date == EMPTY_HIGH_SCORE["date"] else datetime.strptime(date, DISPLAY_DATE_FORMAT)
+        except Exception as e:
+            print(f"Erro ao importar high score antigo: {e}")
+            return
+        self.add_many([(legacy.get("name", "Jogador"), legacy["score"], played_at)])
+
+    # ------------------------------------------------------
+    # CACHE
+    # ------------------------------------------------------
+    def _revalidate(self):
+        """Descarta o cache se outra conexão gravou no banco desde a última olhada"""
+        now = time.monotonic()
+        if now < self.next_check:
+            return
+        self.next_check = now + self.check_interval
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self.data_version:
+            self.data_version = version
+            self.best_entry = None
+            self.sorted_scores = None
+
+    def _scores(self):
+        if self.sorted_scores is None:
+            rows = self.conn.execute("SELECT score FROM scores ORDER BY score")
+            self.sorted_scores = [row[0] for row in rows]
+        return self.sorted_scores
+
+    # ------------------------------------------------------
+    # GRAVAÇÃO
+    # ------------------------------------------------------
+    def add(self, score, name="Jogador", played_at=None):
+        self.add_many([(name, score, played_at)])
+
+    def add_many(self, records):
+        """Insere vários resultados (nome, pontos, datetime ou None) numa transação"""
+        rows = []
+        for name, score, played_at in records:
+            name = name if name and name.strip() else "Jogador"
+            played_at = (played_at or datetime.now()).strftime(DATE_FORMAT)
+            rows.append((name, score, played_at))
+        with self.conn:
+            self.conn.executemany("INSERT INTO scores (name, score, played_at) VALUES (?, ?, ?)", rows)
+
+        # data_version só muda com escritas de outras conexões; as nossas
+        # atualizam o cache aqui mesmo
+        if self.sorted_scores is not None:
+            if len(rows) > 64:
+                self.sorted_scores.extend(row[1] for row in rows)
+                self.sorted_scores.sort()
+            else:
+                for row in rows:
+                    bisect.insort(self.sorted_scores, row[1])
+        if self.best_entry is not None:
+            for name, score, played_at in rows:
+                if score > self.best_entry["score"]:
+                    self.best_entry = _row_to_entry((name, score, played_at))
+
+    # ------------------------------------------------------
+    # CONSULTAS
+    # ------------------------------------------------------
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def report(self):
+        lookups = self.hits + self.misses
+        if not lookups:
+            return "Placar: nenhuma consulta do recorde"
+        return (f"Placar: {lookups} consultas do recorde, {self.hits} da memória "
+                f"({self.hits / lookups:.1%}), {self.misses} no banco")
+
+    def best(self):
+        """Maior pontuação de todas, respondida da memória quando possível"""
+        self._revalidate()
+        if self.best_entry is not None:
+            self.hits += 1
+            return self.best_entry
+        self.misses += 1
+        row = self.conn.execute(
+            "SELECT name, score, played_at FROM scores ORDER BY score DESC, id LIMIT 1").fetchone()
+        self.best_entry = _row_to_entry(row) if row else dict(EMPTY_HIGH_SCORE)
+        return self.best_entry
+
+    def is_high_score(self, score):
+        return score > self.best()["score"]
+
+    def rank(self, score):
+        """Posição que essa pontuação ocuparia (1 = primeiro), por busca binária"""
+        self._revalidate()
+        scores = self._scores()
+        return len(scores) - bisect.bisect_right(scores, score) + 1
+
+    def top(self, limit=10, offset=0):
+        rows = self.conn.execute(
+            "SELECT name, score, played_at FROM scores ORDER BY score DESC, id LIMIT ? OFFSET ?",
+            (limit, offset))
+        return [_row_to_entry(row) for row in rows]
+
+    def page(self, page, page_size=10):
+        """Página `page` (a partir de 0) do placar geral"""
+        return self.top(page_size, page * page_size)
+
+    def top_for_player(self, name, limit=10, offset=0):
+        rows = self.conn.execute(
+            "SELECT name, score, played_at FROM scores WHERE name = ? "
+            "ORDER BY score DESC, id LIMIT ? OFFSET ?",
+            (name, limit, offset))
+        return [_row_to_entry(row) for row in rows]
+
+    def top_between(self, start, end, limit=10, offset=0):
+        """Melhores resultados com start <= data < end (datetimes)"""
+        rows = self.conn.execute(
+            "SELECT name, score, played_at FROM scores WHERE played_at >= ? AND played_at < ? "
+            "ORDER BY score DESC, id LIMIT ? OFFSET ?",
+            (start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT), limit, offset))
+        return [_row_to_entry(row) for row in rows]
@@ -0,0 +1,106 @@
+##############################################################
+###      S P A C E   E S C A P E  -  M E T E O R O S       ###
+##############################################################
+### Campo de meteoros em estrutura de arrays (NumPy): uma  ###
+### coluna por atributo em vez de uma lista de [Rect, tipo]###
+### Mover, achar quem saiu da tela, renascer e testar a    ###
+### nave são uma operação vetorizada cada.                 ###
+##############################################################
+
+import numpy as np
+
+METEOR_W, METEOR_H = 40, 40
+
+
+class MeteorField:
+    """Meteoros guardados em colunas x, y, w, h, type e alive.
+
+    Cada meteoro ocupa um slot fixo; quando sai da tela ou é destruído ele
+    renasce no mesmo slot, então os índices são estáveis durante a partida.
+    """
+
+    def __init__(self, capacity=16):
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.w = np.zeros(capacity, dtype=np.int32)
+        self.h = np.zeros(capacity, dtype=np.int32)
+        self.type = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.size = 0  # Slots em uso: [0, size)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self.size]))
+
+    def _grow(self, needed):
+        capacity = len(self.x)
+        while capacity < needed:
+            capacity *= 2
+        for name in ("x", "y", "w", "h", "type", "alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def clear(self):
+        self.alive[:self.size] = False
+        self.size = 0
+
+    def add(self, x, y, meteor_type, w=METEOR_W, h=METEOR_H):
+        """Acrescenta um meteoro num slot novo e devolve o índice"""
+        i = self.size
+        if i >= len(self.x):
+            self._grow(i + 1)
+        self.x[i] = x
+        self.y[i] = y
+        self.w[i] = w
+        self.h[i] = h
+        self.type[i] = meteor_type
+        self.alive[i] = True
+        self.size = i + 1
+        return i
+
+    def load(self, xs, ys, types, w=METEOR_W, h=METEOR_H):
+        """Substitui o campo inteiro pelos meteoros dados (vetorizado)"""
+        n = len(xs)
+        self.clear()
+        if n > len(self.x):
+            self._grow(n)
+        self.x[:n] = xs
+        self.y[:n] = ys
+        self.w[:n] = w
+        self.h[:n] = h
+        self.type[:n] = types
+        self.alive[:n] = True
+        self.size = n
+
+    def move(self, dy):
+        """Desloca todos os meteoros vivos"""
+        n = self.size
+        self.y[:n] += dy
+
+    def below(self, limit):
+        """Índices dos meteoros vivos com y > limit"""
+        n = self.size
+        return (self.alive[:n] & (self.y[:n] > limit)).nonzero()[0]
+
+    def overlapping(self, rect):
+        """Índices dos meteoros vivos que sobrepõem rect (mesmo critério do colliderect)"""
+        n = self.size
+        x, y = self.x[:n], self.y[:n]
+        mask = (self.alive[:n]
+                & (x < rect.right) & (x + self.w[:n] > rect.left)
+                & (y < rect.bottom) & (y + self.h[:n] > rect.top))
+        return mask.nonzero()[0]
+
+    def respawn(self, slots, xs, ys, types):
+        """Reescreve de uma vez os slots com as novas posições e tipos"""
+        self.x[slots] = xs
+        self.y[slots] = ys
+        self.type[slots] = types
+        self.alive[slots] = True
+
+    def items(self):
+        """(x, y, tipo) de cada meteoro vivo, para desenhar e salvar"""
+        n = self.size
+        alive = self.alive[:n]
+        return zip(self.x[:n][alive].tolist(), self.y[:n][alive].tolist(), self.type[:n][alive].tolist())
@@ -0,0 +1,122 @@
+##############################################################
+###        S P A C E   E S C A P E  -  P R O F I L E R     ###
+##############################################################
+### Mede com perf_counter_ns quanto cada fase do quadro    ###
+### custa (eventos, núcleo, desenho, flip...), guarda uma  ###
+### janela deslizante para p50/p95/p99, mostra um overlay  ###
+### e pode gravar cada quadro num CSV. Desligado, o loop   ###
+### só testa uma variável local por fase.                  ###
+##############################################################
+
+import csv
+import time
+
+import numpy as np
+import pygame
+
+from textCache import get_font
+
+# Fases, na ordem em que acontecem no quadro; de 2 a 5 são as de step(),
+# definidas em gameCore (PHASE_PLAYER a PHASE_EXPLOSIONS)
+PHASE_EVENTS = 0
+PHASE_INPUT = 1
+PHASE_TICK_EXTRAS = 6  # Gravação, rewind e fila de sons entre os ticks
+PHASE_DRAW = 7
+PHASE_HUD = 8
+PHASE_FLIP = 9
+PHASE_NAMES = ("eventos", "entrada", "jogador", "mísseis", "meteoros", "explosões",
+               "extras", "desenho", "hud", "flip")
+
+PROFILE_WINDOW = 600  # Quadros na janela dos percentis (10 s a 60 FPS)
+OVERLAY_REFRESH = 15  # Quadros entre duas atualizações do overlay
+
+
+class FrameProfiler:
+    """Tempos por fase de cada quadro, com percentis móveis"""
+
+    def __init__(self, window=PROFILE_WINDOW, csv_path=None):
+        self.enabled = False
+        self.overlay = False
+        self.samples = np.zeros((window, len(PHASE_NAMES)), dtype=np.int64)
+        self.current = [0] * len(PHASE_NAMES)
+        self.frames = 0  # Quadros medidos desde o início
+        self.last = 0
+        self.overlay_surface = None
+
+        self.csv_file = None
+        self.csv_writer = None
+        if csv_path:
+            self.csv_file = open(csv_path, 'w', newline='')
+            self.csv_writer = csv.writer(self.csv_file)
+            self.csv_writer.writerow(("quadro",) + PHASE_NAMES + ("total",))
+            self.enabled = True
+
+    def toggle_overlay(self):
+        """Liga/desliga o overlay; sem CSV a medição acompanha o overlay"""
+        self.overlay = not self.overlay
+        self.enabled = self.overlay or self.csv_writer is not None
+        self.overlay_surface = None
+
+    def begin_frame(self):
+        self.current = [0] * len(PHASE_NAMES)
+        self.last = time.perf_counter_ns()
+
+    def mark(self, phase):
+        """Soma à fase o tempo desde a última marca"""
+        now = time.perf_counter_ns()
+        self.current[phase] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        self.samples[self.frames % len(self.samples)] = self.current
+        if self.csv_writer is not None:
+            self.csv_writer.writerow([self.frames] + self.current + [sum(self.current)])
+        self.frames += 1
+        if self.overlay and self.frames % OVERLAY_REFRESH == 0:
+            self.overlay_surface = None
+
+    def percentiles(self):
+        """Matriz (3, fases) com p50, p95 e p99 em ns sobre a janela"""
+        n = min(self.frames, len(self.samples))
+        if n == 0:
+            return np.zeros((3, len(PHASE_NAMES)))
+        return np.percentile(self.samples[:n], (50, 95, 99), axis=0)
+
+    def overlay_image(self):
+        """Tabela de percentis em ms; refeita a cada OVERLAY_REFRESH quadros"""
+        if self.overlay_surface is None:
+            table = self.percentiles() / 1e6
+            n = min(self.frames, len(self.samples))
+            totals = np.percentile(self.samples[:n].sum(axis=1), (50, 95, 99)) / 1e6 if n else (0, 0, 0)
+            rows = [("fase", "p50", "p95", "p99")]
+            for i, name in enumerate(PHASE_NAMES):
+                rows.append((name, *(f"{table[k, i]:.2f}" for k in range(3))))
+            rows.append(("total", *(f"{value:.2f}" for value in totals)))
+
+            font = get_font(20)
+            height = font.get_linesize()
+            surface = pygame.Surface((250, height * len(rows) + 8), pygame.SRCALPHA)
+            surface.fill((0, 0, 0, 170))
+            for row, (name, *values) in enumerate(rows):
+                y = 4 + row * height
+                surface.blit(font.render(name, True, (200, 255, 200)), (6, y))
+                # Números alinhados à direita de cada coluna
+                for col, value in enumerate(values):
+                    text = font.render(value, True, (200, 255, 200))
+                    surface.blit(text, (135 + col * 55 - text.get_width(), y))
+            self.overlay_surface = surface
+        return self.overlay_surface
+
+    def report(self):
+        if not self.frames:
+            return "Profiler: nenhum quadro medido"
+        table = self.percentiles() / 1e6
+        worst = int(np.argmax(table[2]))
+        return (f"Profiler: {self.frames} quadros medidos; fase mais lenta no p99: "
+                f"{PHASE_NAMES[worst]} ({table[2, worst]:.2f} ms)")
+
+    def close(self):
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
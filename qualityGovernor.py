@@ -0,0 +1,86 @@
+##############################################################
+###      S P A C E   E S C A P E  -  Q U A L I D A D E     ###
+##############################################################
+### Acompanha o tempo de trabalho dos últimos quadros e,   ###
+### quando o orçamento de 16,6 ms estoura, desce um nível  ###
+### de qualidade (menos explosões, sem anel do escudo, HUD ###
+### atualizado mais devagar). Com folga por algum tempo,   ###
+### sobe de volta. Cada troca de nível fica registrada.    ###
+##############################################################
+
+from collections import deque
+
+from gameCore import FPS
+
+# Do melhor para o mais leve: explosões desenhadas no máximo (as mais
+# novas), anel do escudo e de quantos em quantos quadros o HUD é refeito
+QUALITY_LEVELS = (
+    {"name": "máxima", "explosions": None, "shield": True, "hud_every": 1},
+    {"name": "alta", "explosions": 8, "shield": True, "hud_every": 2},
+    {"name": "média", "explosions": 3, "shield": False, "hud_every": 4},
+    {"name": "mínima", "explosions": 0, "shield": False, "hud_every": 8},
+)
+
+GOVERNOR_WINDOW = 30  # Quadros na média móvel
+DEGRADE_RATIO = 1.0  # Média acima do orçamento: desce um nível
+RESTORE_RATIO = 0.6  # Média abaixo disso do orçamento: pode subir
+RESTORE_FRAMES = 120  # Quadros seguidos com folga antes de subir (2 s)
+
+
+class QualityGovernor:
+    """Escolhe o nível de qualidade pelo tempo de trabalho dos quadros"""
+
+    def __init__(self, budget_ms=1000 / FPS, window=GOVERNOR_WINDOW, enabled=True):
+        self.budget_ms = budget_ms
+        self.enabled = enabled
+        self.samples = deque(maxlen=window)
+        self.total = 0.0  # Soma da janela, para não somar a deque a cada quadro
+        self.level = 0
+        self.settings = QUALITY_LEVELS[0]
+        self.headroom_frames = 0
+
+        self.frames = 0
+        self.frames_per_level = [0] * len(QUALITY_LEVELS)
+        self.transitions = []  # (quadro, nível de, nível para, média em ms)
+
+    def update(self, work_ms):
+        """Registra o tempo de trabalho do quadro (sem a espera do clock)
+        e devolve o nível a usar no próximo"""
+        self.frames += 1
+        self.frames_per_level[self.level] += 1
+        samples = self.samples
+        if len(samples) == samples.maxlen:
+            self.total -= samples[0]
+        samples.append(work_ms)
+        self.total += work_ms
+        # Só decide com a janela cheia: no começo e depois de cada troca
+        if not self.enabled or len(samples) < samples.maxlen:
+            return self.level
+
+        mean = self.total / len(samples)
+        if mean > self.budget_ms * DEGRADE_RATIO and self.level < len(QUALITY_LEVELS) - 1:
+            self._change(self.level + 1, mean)
+        elif mean < self.budget_ms * RESTORE_RATIO and self.level > 0:
+            self.headroom_frames += 1
+            if self.headroom_frames >= RESTORE_FRAMES:
+                self._change(self.level - 1, mean)
+        else:
+            self.headroom_frames = 0
+        return self.level
+
+    def _change(self, level, mean):
+        self.transitions.append((self.frames, self.level, level, mean))
+        self.level = level
+        self.settings = QUALITY_LEVELS[level]
+        self.headroom_frames = 0
+        self.samples.clear()
+        self.total = 0.0
+
+    def report(self):
+        if not self.frames:
+            return "Qualidade: nenhum quadro"
+        time_at = ", ".join(f"{settings['name']} {count / self.frames:.0%}"
+                            for settings, count in zip(QUALITY_LEVELS, self.frames_per_level) if count)
+        downs = sum(1 for _, old, new, _ in self.transitions if new > old)
+        return (f"Qualidade: nível final {self.settings['name']}, {len(self.transitions)} trocas "
+                f"({downs} para baixo); tempo em cada nível: {time_at}")
@@ -0,0 +1,141 @@
+##############################################################
+###          S P A C E   E S C A P E  -  R E P L A Y       ###
+##############################################################
+### Grava a semente da partida e, a cada tick, um byte com ###
+### as teclas (setas, espaço, S, R). O replay refaz a      ###
+### partida sem janela, o mais rápido possível, e confere  ###
+### se pontuação e vidas batem com as gravadas.            ###
+##############################################################
+
+import struct
+import time
+import zlib
+
+from gameCore import (
+    INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN, INPUT_FIRE,
+    GameState, apply_saved_state, step, tick_ms,
+)
+from rewind import REWIND_STEP_SECONDS, RewindBuffer
+from saveSystem import decode_binary, encode_binary, snapshot_state, write_atomic
+
+# Bits além das entradas do núcleo: S e R também entram na gravação
+INPUT_SAVE = 32
+INPUT_REWIND = 64
+GAME_INPUTS = INPUT_LEFT | INPUT_RIGHT | INPUT_UP | INPUT_DOWN | INPUT_FIRE
+
+# Cabeçalho: assinatura, versão, semente, ticks por segundo, relógio
+# inicial, pontuação e vidas finais, quantidade de ticks, tamanho do
+# estado inicial (save carregado; 0 = partida nova) e flags. Depois vêm o
+# estado inicial no formato binário do save e os bytes por tick comprimidos.
+REPLAY_MAGIC = b"SERP"
+REPLAY_VERSION = 2
+REPLAY_HEADER = struct.Struct("<4sHQHdiiIIB")
+REPLAY_HEADER_V1 = struct.Struct("<4sHQHdiiII")  # Sem flags: só colisão por retângulo
+REPLAY_VERSION_PREFIX = struct.Struct("<4sH")
+
+REPLAY_PIXEL_COLLISIONS = 1  # Flag: partida jogada com colisão por máscara
+
+
+class InputRecorder:
+    """Guarda a semente e as teclas de cada tick de uma partida"""
+
+    def __init__(self, state, tick_rate, loaded_save=False, pixel_collisions=False):
+        self.seed = state.seed
+        self.tick_rate = tick_rate
+        self.start_time = state.time
+        self.flags = REPLAY_PIXEL_COLLISIONS if pixel_collisions else 0
+        # Com um save carregado o replay precisa partir do mesmo estado
+        self.initial_state = encode_binary(snapshot_state(state)) if loaded_save else b""
+        self.inputs = bytearray()
+        self.pending = 0  # S/R apertados desde o último tick
+
+    def flag(self, bit):
+        """Marca S ou R; entra no byte do próximo tick"""
+        self.pending |= bit
+
+    def record(self, inputs):
+        self.inputs.append(inputs | self.pending)
+        self.pending = 0
+
+    def encode(self, state):
+        header = REPLAY_HEADER.pack(
+            REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.tick_rate, self.start_time,
+            state.score, state.lives, len(self.inputs), len(self.initial_state), self.flags)
+        return header + self.initial_state + zlib.compress(bytes(self.inputs), 9)
+
+    def save(self, path, state):
+        """Grava o replay com o resultado final de `state`"""
+        try:
+            write_atomic(path, self.encode(state))
+            return True
+        except Exception as e:
+            print(f"Erro ao gravar replay: {e}")
+            return False
+
+
+def decode_replay(data):
+    magic, version = REPLAY_VERSION_PREFIX.unpack_from(data)
+    if magic != REPLAY_MAGIC or version not in (1, REPLAY_VERSION):
+        raise ValueError("arquivo de replay inválido")
+    if version == 1:
+        header = REPLAY_HEADER_V1
+        (_, _, seed, tick_rate, start_time, score, lives, ticks, initial_size) = header.unpack_from(data)
+        flags = 0
+    else:
+        header = REPLAY_HEADER
+        (_, _, seed, tick_rate, start_time, score, lives, ticks, initial_size, flags) = header.unpack_from(data)
+    offset = header.size
+    initial_state = data[offset:offset + initial_size]
+    inputs = zlib.decompress(data[offset + initial_size:])
+    if len(inputs) != ticks:
+        raise ValueError("replay truncado")
+    return {
+        "seed": seed,
+        "tick_rate": tick_rate,
+        "start_time": start_time,
+        "score": score,
+        "lives": lives,
+        "initial_state": initial_state,
+        "inputs": inputs,
+        "flags": flags,
+    }
+
+
+def load_replay(path):
+    with open(path, 'rb') as f:
+        return decode_replay(f.read())
+
+
+def run_replay(recording, rules=None, masks=None):
+    """Refaz a partida gravada sem relógio e confere o resultado. Partidas
+    com colisão por pixel precisam das mesmas máscaras (`masks`)."""
+    if recording["flags"] & REPLAY_PIXEL_COLLISIONS and masks is None:
+        raise ValueError("replay gravado com colisão por pixel; passe as máscaras")
+    tick_rate = recording["tick_rate"]
+    dt = tick_ms(tick_rate)
+    state = GameState(seed=recording["seed"], rules=rules)
+    if recording["initial_state"]:
+        apply_saved_state(state, decode_binary(recording["initial_state"]))
+    state.time = recording["start_time"]
+    rewind_buffer = RewindBuffer(tick_rate=tick_rate)
+    rewind_ticks = REWIND_STEP_SECONDS * tick_rate
+
+    inputs = recording["inputs"]
+    start = time.perf_counter()
+    for mask in inputs:
+        if mask & INPUT_REWIND:
+            rewind_buffer.rewind(state, rewind_ticks)
+        step(state, mask & GAME_INPUTS, dt, masks)
+        rewind_buffer.maybe_capture(state)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": len(inputs),
+        "seconds": elapsed,
+        "ticks_per_second": len(inputs) / elapsed if elapsed > 0 else float("inf"),
+        "score": state.score,
+        "lives": state.lives,
+        "expected_score": recording["score"],
+        "expected_lives": recording["lives"],
+        "match": state.score == recording["score"] and state.lives == recording["lives"],
+    }
@@ -0,0 +1,167 @@
+##############################################################
+###         S P A C E   E S C A P E  -  R E W I N D        ###
+##############################################################
+### Autosave em memória: a cada N ticks uma foto compacta  ###
+### do GameState vai para um buffer circular de tamanho    ###
+### fixo. Uma tecla volta o jogo alguns segundos no tempo. ###
+##############################################################
+
+import time
+
+import numpy as np
+
+from gameCore import TICK_RATE, rebuild_meteor_grid
+from saveSystem import METEOR_RECORD
+
+SNAPSHOT_INTERVAL = 10  # Ticks entre duas fotos (6 por segundo a 60 ticks/s)
+REWIND_SECONDS = 10  # Quanto histórico o buffer guarda
+REWIND_STEP_SECONDS = 2  # Quanto cada toque na tecla volta
+CAPTURE_BUDGET_NS = 200_000  # Uma foto não pode custar mais que 0,2 ms
+
+MISSILE_RECORD = np.dtype([("x", "<i2"), ("y", "<i2")])
+EXPLOSION_RECORD = np.dtype([("x", "<i2"), ("y", "<i2"), ("start", "<f8")])
+
+
+class Snapshot:
+    """Uma posição do buffer; os arrays são reaproveitados entre capturas"""
+
+    def __init__(self):
+        self.tick = -1
+        self.scalars = None
+        self.meteors = np.empty(16, dtype=METEOR_RECORD)
+        self.meteor_count = 0
+        self.missiles = np.empty(64, dtype=MISSILE_RECORD)
+        self.missile_count = 0
+        self.explosions = np.empty(32, dtype=EXPLOSION_RECORD)
+        self.explosion_count = 0
+        self.rng_state = None
+        self.np_rng_state = None
+
+
+def _fit(array, n):
+    """Garante espaço para n registros, realocando só quando falta"""
+    if len(array) < n:
+        return np.empty(max(n, 2 * len(array)), dtype=array.dtype)
+    return array
+
+
+class RewindBuffer:
+    """Buffer circular de fotos do GameState"""
+
+    def __init__(self, seconds=REWIND_SECONDS, interval=SNAPSHOT_INTERVAL, budget_ns=CAPTURE_BUDGET_NS,
+                 tick_rate=TICK_RATE):
+        self.interval = interval
+        self.budget_ns = budget_ns
+        self.slots = [Snapshot() for _ in range(max(1, seconds * tick_rate // interval))]
+        self.head = 0  # Próxima posição a ser escrita
+        self.count = 0
+        self.last_tick = None
+
+        # Custo das capturas, para conferir que nunca vira um pico no quadro
+        self.captures = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.over_budget = 0
+
+    def maybe_capture(self, state):
+        """Tira uma foto se já passaram `interval` ticks desde a última"""
+        if self.last_tick is None or state.ticks - self.last_tick >= self.interval:
+            self.capture(state)
+
+    def capture(self, state):
+        start = time.perf_counter_ns()
+        slot = self.slots[self.head]
+        slot.tick = state.ticks
+        slot.scalars = (state.score, state.lives, state.player_shield, state.player_weapon_upgrade,
+                        state.weapon_upgrade_time, state.last_shot_time, state.time, state.ticks,
+                        state.player_rect.x, state.player_rect.y, state.running,
+                        state.player_carry, state.meteor_carry, state.missile_carry)
+
+        meteors = state.meteors
+        n = meteors.size
+        alive = meteors.alive[:n]
+        m = int(np.count_nonzero(alive))
+        slot.meteors = _fit(slot.meteors, m)
+        records = slot.meteors[:m]
+        records["x"] = meteors.x[:n][alive]
+        records["y"] = meteors.y[:n][alive]
+        records["type"] = meteors.type[:n][alive]
+        slot.meteor_count = m
+
+        missiles = state.missiles
+        slot.missiles = _fit(slot.missiles, missiles.count)
+        for i, rect in enumerate(missiles):
+            slot.missiles[i] = (rect.x, rect.y)
+        slot.missile_count = missiles.count
+
+        explosions = state.explosions
+        slot.explosions = _fit(slot.explosions, explosions.count)
+        for i, rect in enumerate(explosions):
+            slot.explosions[i] = (rect.x, rect.y, explosions.values[i])
+        slot.explosion_count = explosions.count
+
+        slot.rng_state = state.rng.getstate()
+        slot.np_rng_state = state.np_rng.bit_generator.state
+
+        self.head = (self.head + 1) % len(self.slots)
+        self.count = min(self.count + 1, len(self.slots))
+        self.last_tick = state.ticks
+
+        cost = time.perf_counter_ns() - start
+        self.captures += 1
+        self.total_ns += cost
+        self.max_ns = max(self.max_ns, cost)
+        if cost > self.budget_ns:
+            self.over_budget += 1
+
+    def rewind(self, state, ticks_back):
+        """Volta o estado para a foto mais recente com pelo menos `ticks_back`
+        ticks de idade (ou a mais antiga). As fotos mais novas são descartadas,
+        então apertar de novo volta ainda mais. Devolve False se não há fotos."""
+        if self.count == 0:
+            return False
+        target = state.ticks - ticks_back
+        capacity = len(self.slots)
+        for age in range(1, self.count + 1):
+            slot = self.slots[(self.head - age) % capacity]
+            if slot.tick <= target or age == self.count:
+                break
+
+        # A foto escolhida vira a mais nova do buffer
+        self.head = (self.head - age + 1) % capacity
+        self.count -= age - 1
+        self.last_tick = slot.tick
+        restore_snapshot(state, slot)
+        return True
+
+    def report(self):
+        mean_us = self.total_ns / self.captures / 1000 if self.captures else 0.0
+        return (f"Rewind: {self.captures} fotos, custo médio {mean_us:.1f} µs, "
+                f"máximo {self.max_ns / 1000:.1f} µs, {self.over_budget} acima do orçamento")
+
+
+def restore_snapshot(state, slot):
+    """Aplica uma foto do buffer num GameState"""
+    (state.score, state.lives, state.player_shield, state.player_weapon_upgrade,
+     state.weapon_upgrade_time, state.last_shot_time, state.time, state.ticks,
+     state.player_rect.x, state.player_rect.y, state.running,
+     state.player_carry, state.meteor_carry, state.missile_carry) = slot.scalars
+    # Sem isso o primeiro quadro interpolaria a partir da posição de antes do rewind
+    state.prev_player_pos = state.player_rect.topleft
+    state.meteor_dy = 0
+    state.missile_dy = 0
+
+    records = slot.meteors[:slot.meteor_count]
+    state.meteors.load(records["x"], records["y"], records["type"])
+    rebuild_meteor_grid(state)
+
+    state.missiles.clear()
+    for x, y in slot.missiles[:slot.missile_count].tolist():
+        state.missiles.acquire(x, y)
+
+    state.explosions.clear()
+    for x, y, start in slot.explosions[:slot.explosion_count].tolist():
+        state.explosions.acquire(x, y, start)
+
+    state.rng.setstate(slot.rng_state)
+    state.np_rng.bit_generator.state = slot.np_rng_state
@@ -0,0 +1,204 @@
+##############################################################
+###            S P A C E   E S C A P E  -  S A V E         ###
+##############################################################
+### O loop do jogo só tira uma foto barata do estado; uma  ###
+### thread de fundo serializa e grava de forma atômica     ###
+### (temporário + rename). Dois formatos: JSON e um        ###
+### binário compacto com os meteoros empacotados.          ###
+##############################################################
+
+import json
+import os
+import queue
+import struct
+import tempfile
+import threading
+from datetime import datetime
+
+import numpy as np
+
+SAVE_FILE_JSON = "game_save.json"
+SAVE_FILE_BINARY = "game_save.bin"
+SAVE_FILES = (SAVE_FILE_BINARY, SAVE_FILE_JSON)
+
+FORMAT_JSON = "json"
+FORMAT_BINARY = "binary"
+
+# Cabeçalho do formato binário: assinatura, versão, instante, pontuação,
+# vidas, posição da nave, escudos, upgrade de arma, fim do upgrade e
+# quantidade de meteoros. Depois vêm os meteoros (x, y, tipo).
+BINARY_MAGIC = b"SESV"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sHdiiiiiBqI")
+METEOR_RECORD = np.dtype([("x", "<i2"), ("y", "<i2"), ("type", "u1")])
+
+
+def snapshot_state(state):
+    """Foto do estado para salvar; barata o bastante para o loop do jogo"""
+    meteors = state.meteors
+    alive = meteors.alive[:meteors.size]
+    return {
+        "timestamp": datetime.now().timestamp(),
+        "score": state.score,
+        "lives": state.lives,
+        "player_x": state.player_rect.x,
+        "player_y": state.player_rect.y,
+        "shield": state.player_shield,
+        "weapon_upgrade": state.player_weapon_upgrade,
+        "weapon_upgrade_time": int(state.weapon_upgrade_time),
+        "meteor_x": meteors.x[:meteors.size][alive],
+        "meteor_y": meteors.y[:meteors.size][alive],
+        "meteor_type": meteors.type[:meteors.size][alive],
+    }
+
+
+# ----------------------------------------------------------
+# FORMATOS
+# ----------------------------------------------------------
+def encode_json(snapshot):
+    game_state = {
+        "timestamp": datetime.fromtimestamp(snapshot["timestamp"]).isoformat(),
+        "score": snapshot["score"],
+        "lives": snapshot["lives"],
+        "player_x": snapshot["player_x"],
+        "player_y": snapshot["player_y"],
+        "shield": snapshot["shield"],
+        "weapon_upgrade": snapshot["weapon_upgrade"],
+        "weapon_upgrade_time": snapshot["weapon_upgrade_time"],
+        "meteors": [
+            {"x": x, "y": y, "type": t}
+            for x, y, t in zip(snapshot["meteor_x"].tolist(), snapshot["meteor_y"].tolist(),
+                               snapshot["meteor_type"].tolist())
+        ]
+    }
+    return json.dumps(game_state, indent=4).encode("utf-8")
+
+
+def encode_binary(snapshot):
+    records = np.empty(len(snapshot["meteor_x"]), dtype=METEOR_RECORD)
+    records["x"] = snapshot["meteor_x"]
+    records["y"] = snapshot["meteor_y"]
+    records["type"] = snapshot["meteor_type"]
+    header = BINARY_HEADER.pack(
+        BINARY_MAGIC, BINARY_VERSION, snapshot["timestamp"],
+        snapshot["score"], snapshot["lives"], snapshot["player_x"], snapshot["player_y"],
+        snapshot["shield"], int(snapshot["weapon_upgrade"]), snapshot["weapon_upgrade_time"],
+        len(records))
+    return header + records.tobytes()
+
+
+def decode_binary(data):
+    (magic, version, timestamp, score, lives, player_x, player_y, shield,
+     weapon_upgrade, weapon_upgrade_time, count) = BINARY_HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError("arquivo de save binário inválido")
+    records = np.frombuffer(data, dtype=METEOR_RECORD, count=count, offset=BINARY_HEADER.size)
+    return {
+        "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+        "score": score,
+        "lives": lives,
+        "player_x": player_x,
+        "player_y": player_y,
+        "shield": shield,
+        "weapon_upgrade": bool(weapon_upgrade),
+        "weapon_upgrade_time": weapon_upgrade_time,
+        "meteors": [
+            {"x": x, "y": y, "type": t}
+            for x, y, t in zip(records["x"].tolist(), records["y"].tolist(), records["type"].tolist())
+        ]
+    }
+
+
+def decode(data):
+    """Lê qualquer um dos formatos, reconhecendo o binário pela assinatura"""
+    if data[:len(BINARY_MAGIC)] == BINARY_MAGIC:
+        return decode_binary(data)
+    return json.loads(data.decode("utf-8"))
+
+
+ENCODERS = {FORMAT_JSON: encode_json, FORMAT_BINARY: encode_binary}
+SAVE_PATHS = {FORMAT_JSON: SAVE_FILE_JSON, FORMAT_BINARY: SAVE_FILE_BINARY}
+
+
+def write_atomic(path, data):
+    """Grava num temporário do mesmo diretório e troca pelo destino"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)  # mkstemp cria com 0600
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_game(snapshot, save_format=FORMAT_JSON):
+    """Serializa e grava um snapshot (síncrono; a SaveWriter chama isto na thread)"""
+    path = SAVE_PATHS[save_format]
+    try:
+        write_atomic(path, ENCODERS[save_format](snapshot))
+        return True
+    except Exception as e:
+        print(f"Erro ao salvar: {e}")
+        return False
+
+
+def load_game(paths=SAVE_FILES):
+    """Carrega o save mais recente, em JSON ou binário"""
+    existing = [path for path in paths if os.path.exists(path)]
+    if not existing:
+        return None
+    path = max(existing, key=os.path.getmtime)
+
+    try:
+        with open(path, 'rb') as f:
+            return decode(f.read())
+    except Exception as e:
+        print(f"Erro ao carregar: {e}")
+        return None
+
+
+# ----------------------------------------------------------
+# GRAVAÇÃO EM SEGUNDO PLANO
+# ----------------------------------------------------------
+class SaveWriter:
+    """Thread que grava os snapshots enviados pelo loop do jogo"""
+
+    def __init__(self, save_format=FORMAT_JSON):
+        self.save_format = save_format
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            snapshot = self.requests.get()
+            if snapshot is None:
+                return
+            self.results.put(save_game(snapshot, self.save_format))
+
+    def submit(self, snapshot):
+        """Enfileira um snapshot e volta na hora"""
+        self.requests.put(snapshot)
+
+    def poll(self):
+        """Resultados (True/False) das gravações terminadas desde a última chamada"""
+        done = []
+        while True:
+            try:
+                done.append(self.results.get_nowait())
+            except queue.Empty:
+                return done
+
+    def close(self):
+        """Espera as gravações pendentes terminarem"""
+        self.requests.put(None)
+        self.thread.join()
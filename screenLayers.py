@@ -0,0 +1,93 @@
+##############################################################
+###        S P A C E   E S C A P E  -  C A M A D A S       ###
+##############################################################
+### As telas de introdução, menu e placar são montadas de  ###
+### camadas pré-compostas: o fundo estático é desenhado    ###
+### uma vez e só os detalhes que mudam (texto piscando,    ###
+### opção destacada) são refeitos, e só quando mudam.      ###
+### Fora do jogo o loop dorme em pygame.event.wait até o   ###
+### próximo evento ou a próxima mudança agendada.          ###
+##############################################################
+
+import time
+
+import pygame
+
+
+class CachedLayer:
+    """Superfície montada por build(surface, *inputs), refeita só quando os inputs mudam"""
+
+    def __init__(self, size, build, fill=None):
+        self.size = size
+        self.build = build
+        self.fill = fill  # None = camada transparente (overlay)
+        self.surface = None
+        self.inputs = None
+        self.builds = 0
+
+    def get(self, *inputs):
+        if self.surface is None or inputs != self.inputs:
+            if self.surface is None:
+                flags = pygame.SRCALPHA if self.fill is None else 0
+                self.surface = pygame.Surface(self.size, flags)
+            self.surface.fill(self.fill if self.fill is not None else (0, 0, 0, 0))
+            self.build(self.surface, *inputs)
+            self.inputs = inputs
+            self.builds += 1
+        return self.surface
+
+    def invalidate(self):
+        self.inputs = None
+        self.surface = None
+
+
+class LayeredScreen:
+    """Recompõe a janela só quando a chave com as entradas da tela muda"""
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.key = None
+        self.compositions = 0
+
+    def present(self, key, compose):
+        """Chama compose(screen) e dá flip se `key` mudou; devolve True se desenhou"""
+        if key is not None and key == self.key:
+            return False
+        compose(self.screen)
+        pygame.display.flip()
+        self.key = key
+        self.compositions += 1
+        return True
+
+    def invalidate(self):
+        """Outra tela usou a janela; o próximo present redesenha tudo"""
+        self.key = None
+
+
+class IdleLoop:
+    """Espera de eventos para as telas fora do jogo, contando os despertares"""
+
+    def __init__(self):
+        self.wakeups = 0
+        self.waited = 0.0  # Segundos bloqueados em event.wait
+
+    def wait(self, timeout_ms=None):
+        """Dorme até chegar um evento ou passar `timeout_ms` (None = sem prazo).
+        Devolve os eventos pendentes; lista vazia quando acordou pelo prazo."""
+        start = time.monotonic()
+        if timeout_ms is None:
+            event = pygame.event.wait()
+        else:
+            event = pygame.event.wait(max(1, int(timeout_ms)))
+        self.waited += time.monotonic() - start
+        self.wakeups += 1
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def wakeups_per_second(self):
+        return self.wakeups / self.waited if self.waited else 0.0
+
+    def report(self):
+        return (f"Telas: {self.wakeups} despertares em {self.waited:.1f}s "
+                f"({self.wakeups_per_second():.2f}/s)")
@@ -10,25 +10,55 @@
 ### Prof. Filipo Novo Mor - github.com/ProfessorFilipo     ###
 ##############################################################
 
-import pygame
-import random
+import time
+
+# Tomado antes de qualquer outro import: o tempo até o primeiro quadro inclui
+# carregar pygame, numpy e os módulos do jogo (só fica de fora o interpretador)
+LAUNCH_TIME = time.perf_counter()
+
+import argparse
+import asyncio
 import os
-import json
-from datetime import datetime
+import random
+from functools import partial
 
-pygame.init()
+import pygame
+
+from assetManager import AssetManager
+from audioScheduler import AudioScheduler
+from batchEnv import run_batch
+from collisionMasks import CollisionMasks
+from dirtyRenderer import DirtyRenderer
+from effectCache import EffectCache
+from gameCore import (
+    WIDTH, HEIGHT, FPS, TICK_RATE, CONDICAO_VITORIA, PLAYER_SIZE, MAX_SHIELD,
+    METEOR_TYPE_NORMAL, METEOR_TYPE_BONUS, METEOR_TYPE_POWERUP,
+    INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN, INPUT_FIRE,
+    EVENT_POINT, EVENT_HIT, MASK_PLAYER, MASK_MISSILE, METEOR_MASKS,
+    GameState, apply_saved_state, step, random_policy, run_headless, tick_ms,
+)
+from leaderboard import Leaderboard
+from profiler import (
+    PHASE_EVENTS, PHASE_INPUT, PHASE_TICK_EXTRAS, PHASE_DRAW, PHASE_HUD, PHASE_FLIP, FrameProfiler,
+)
+from qualityGovernor import QUALITY_LEVELS, QualityGovernor
+from replay import INPUT_REWIND, INPUT_SAVE, REPLAY_PIXEL_COLLISIONS, InputRecorder, load_replay, run_replay
+from rewind import REWIND_STEP_SECONDS, RewindBuffer
+from saveSystem import FORMAT_BINARY, FORMAT_JSON, SaveWriter, load_game, snapshot_state
+from screenLayers import CachedLayer, IdleLoop, LayeredScreen
+from spectatorServer import DEFAULT_PORT, SpectatorClient, SpectatorServer
+from textCache import HudLine, render_text
+
+IMPORTS_DONE = time.perf_counter()
 
 # ----------------------------------------------------------
 # CONFIGURAÇÕES
 # ----------------------------------------------------------
-WIDTH, HEIGHT = 800, 600
-FPS = 60
-pygame.display.set_caption("🚀 Space Escape")
-
 ASSETS = {
     "background": "fundo_espacial.png",
     "player": "nave001.png",
     "meteor": "meteoro001.png",
+    "explosion": "explosão.png",
     "sound_point": "classic-game-action-positive-5-224402.mp3",
     "sound_hit": "stab-f-01-brvhrtz-224599.mp3",
     "music": "distorted-future-363866.mp3"
@@ -40,664 +70,791 @@ BLUE = (60, 100, 255)
 YELLOW = (255, 240, 0)
 GREEN = (0, 255, 0)
 
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+MAX_FRAME_MS = 250  # Um quadro travado (janela arrastada, disco) não vira centenas de ticks
+MAX_TICKS_PER_FRAME = 8  # Acima disso o jogo desacelera em vez de entrar em espiral
 
+HIGH_SCORES_PER_PAGE = 10
 
-def load_image(filename, fallback_color, size=None):
-    if os.path.exists(filename):
-        img = pygame.image.load(filename).convert_alpha()
-        if size:
-            img = pygame.transform.scale(img, size)
-        return img
-    else:
-        surf = pygame.Surface(size or (50, 50))
-        surf.fill(fallback_color)
-        return surf
 
+# ----------------------------------------------------------
+# EFEITOS PRÉ-RENDERIZADOS
+# ----------------------------------------------------------
+EXPLOSION_FRAMES = 4  # A explosão some aos poucos ao longo da duração
+
+
+def build_shield_ring(level, size):
+    """Anel do escudo em volta da nave; mais opaco quanto mais escudos"""
+    width, height = size
+    surface = pygame.Surface((width + 20, height + 20), pygame.SRCALPHA)
+    alpha = min(255, 100 + level * 50)
+    pygame.draw.ellipse(surface, (100, 200, 255, alpha), surface.get_rect(), 3)
+    return surface
+
+
+def build_meteor_variant(meteor_img, meteor_type):
+    """Imagem do meteoro com a marcação de bônus/power-up já desenhada"""
+    if meteor_type == METEOR_TYPE_NORMAL:
+        return meteor_img
+    meteor_w = meteor_img.get_width()
+    center = (meteor_w // 2, meteor_w // 2)
+    surface = meteor_img.copy()
+    if meteor_type == METEOR_TYPE_BONUS:
+        pygame.draw.circle(surface, GREEN, center, meteor_w // 4)
+    else:
+        # Brilho ciano/azul para indicar power-up
+        pygame.draw.circle(surface, (0, 255, 255), center, meteor_w // 2, 3)
+        pygame.draw.circle(surface, (100, 200, 255), center, meteor_w // 3)
+    return surface
+
+
+def build_explosion_frame(explosion_img, index):
+    if index == 0:
+        return explosion_img
+    surface = explosion_img.copy()
+    surface.set_alpha(255 - index * 115 // EXPLOSION_FRAMES)
+    return surface
+
+
+def create_effects(player_size, meteor_img, explosion_img):
+    """Registra os efeitos do jogo e desenha de antemão as variantes conhecidas"""
+    effects = EffectCache()
+    effects.register("shield", build_shield_ring)
+    effects.register("meteor", partial(build_meteor_variant, meteor_img))
+    effects.register("explosion", partial(build_explosion_frame, explosion_img), frames=EXPLOSION_FRAMES)
+
+    effects.prebuild("shield", [(level, player_size) for level in range(1, MAX_SHIELD + 1)])
+    effects.prebuild("meteor", [(METEOR_TYPE_NORMAL,), (METEOR_TYPE_BONUS,), (METEOR_TYPE_POWERUP,)])
+    effects.prebuild_frames("explosion")
+    return effects
+
+
+class GameSprites:
+    """Imagens e efeitos usados para desenhar uma partida"""
+
+    def __init__(self, assets):
+        self.background = assets.image(ASSETS["background"], WHITE, (WIDTH, HEIGHT))
+        self.player = assets.image(ASSETS["player"], BLUE, PLAYER_SIZE)
+        meteor_img = assets.image(ASSETS["meteor"], RED, (40, 40))
+        explosion_img = assets.image(ASSETS["explosion"], (255, 100, 0), (60, 60))
+
+        self.missile = pygame.Surface((6, 20))
+        self.missile.fill(YELLOW)
+
+        self.effects = create_effects(PLAYER_SIZE, meteor_img, explosion_img)
+        self.meteor_variants = [self.effects.get("meteor", meteor_type)
+                                for meteor_type in (METEOR_TYPE_NORMAL, METEOR_TYPE_BONUS, METEOR_TYPE_POWERUP)]
+
+    def collision_masks(self):
+        """Máscaras de colisão por pixel tiradas dos próprios sprites"""
+        masks = CollisionMasks()
+        masks.add(MASK_PLAYER, self.player)
+        masks.add(MASK_MISSILE, self.missile)
+        for name, variant in zip(METEOR_MASKS, self.meteor_variants):
+            masks.add(name, variant)
+        return masks
+
+
+def draw_game(renderer, state, sprites, lag, quality=QUALITY_LEVELS[0]):
+    """Enfileira os sprites da partida; `lag` (0-1) recua cada um para
+    interpolar entre o penúltimo e o último tick. `quality` é um nível de
+    QUALITY_LEVELS: sob carga some o escudo e as explosões são limitadas"""
+    effects = sprites.effects
+    player_rect = state.player_rect
+    prev_x, prev_y = state.prev_player_pos
+    player_x = round(player_rect.x - lag * (player_rect.x - prev_x))
+    player_y = round(player_rect.y - lag * (player_rect.y - prev_y))
 
-background = load_image(ASSETS["background"], WHITE, (WIDTH, HEIGHT))
-player_img = load_image(ASSETS["player"], BLUE, (80, 60))
-meteor_img = load_image(ASSETS["meteor"], RED, (40, 40))
+    # Desenhar escudo ao redor da nave se tiver escudos ativos
+    if state.player_shield > 0 and quality["shield"]:
+        shield_surface = effects.get("shield", state.player_shield, player_rect.size)
+        renderer.draw(shield_surface, (player_x - 10, player_y - 10))
 
-missile_img = pygame.Surface((6, 20))
-missile_img.fill(YELLOW)
+    renderer.draw(sprites.player, (player_x, player_y))
 
-def load_sound(filename):
-    if os.path.exists(filename):
-        return pygame.mixer.Sound(filename)
-    return None
+    # Cada tipo de meteoro já tem a marcação desenhada na própria imagem
+    meteor_variants = sprites.meteor_variants
+    meteor_shift = lag * state.meteor_dy
+    renderer.draw_many((meteor_variants[meteor_type], (meteor_x, round(meteor_y - meteor_shift)))
+                       for meteor_x, meteor_y, meteor_type in state.meteors.items())
 
-sound_point = load_sound(ASSETS["sound_point"])
-sound_hit = load_sound(ASSETS["sound_hit"])
+    missile_img = sprites.missile
+    missile_shift = lag * state.missile_dy
+    renderer.draw_many((missile_img, (missile.x, round(missile.y + missile_shift)))
+                       for missile in state.missiles)
 
-if os.path.exists(ASSETS["music"]):
-    pygame.mixer.music.load(ASSETS["music"])
-    pygame.mixer.music.set_volume(0.3)
-    pygame.mixer.music.play(-1)
+    # Explosões: com limite, só as mais novas (as do fim do pool)
+    explosions = state.explosions
+    limit = quality["explosions"]
+    first = 0 if limit is None else max(0, explosions.count - limit)
+    explosion_duration = state.rules.explosion_duration
+    rects, starts = explosions.rects, explosions.values
+    renderer.draw_many((effects.frame("explosion", (state.time - starts[e]) / explosion_duration), rects[e])
+                       for e in range(first, explosions.count))
 
 
 # ----------------------------------------------------------
-# SISTEMA DE SALVAMENTO
+# TELAS PRÉ-COMPOSTAS
 # ----------------------------------------------------------
-SAVE_FILE = "game_save.json"
-
-def save_game(score, lives, player_pos, meteors_data, shield=0, weapon_upgrade=False, weapon_upgrade_time=0):
-    """Salva o estado atual do jogo em um arquivo JSON"""
-    game_state = {
-        "timestamp": datetime.now().isoformat(),
-        "score": score,
-        "lives": lives,
-        "player_x": player_pos[0],
-        "player_y": player_pos[1],
-        "shield": shield,
-        "weapon_upgrade": weapon_upgrade,
-        "weapon_upgrade_time": weapon_upgrade_time,
-        "meteors": []
-    }
-    
-    for meteor_data in meteors_data:
-        if isinstance(meteor_data, list):
-            meteor_rect, meteor_type = meteor_data
-        else:
-            meteor_rect = meteor_data
-            meteor_type = METEOR_TYPE_NORMAL
-        
-        game_state["meteors"].append({
-            "x": meteor_rect.x,
-            "y": meteor_rect.y,
-            "type": meteor_type
-        })
-    
-    try:
-        with open(SAVE_FILE, 'w') as f:
-            json.dump(game_state, f, indent=4)
-        return True
-    except Exception as e:
-        print(f"Erro ao salvar: {e}")
-        return False
+MENU_OPTIONS = ["NOVO JOGO", "HIGH SCORE", "SAIR"]
+MENU_BACKGROUND = (10, 10, 30)
+PRESS_START_Y = HEIGHT - 200  # Topo do bloco que pisca na introdução
 
 
-def load_game():
-    """Carrega o estado do jogo de um arquivo JSON"""
-    if not os.path.exists(SAVE_FILE):
-        return None
-    
-    try:
-        with open(SAVE_FILE, 'r') as f:
-            game_state = json.load(f)
-        return game_state
-    except Exception as e:
-        print(f"Erro ao carregar: {e}")
-        return None
+def centered(surface, text_surface, y, dx=0):
+    surface.blit(text_surface, (WIDTH // 2 - text_surface.get_width() // 2 + dx, y))
+
+
+def build_intro_background(surface, score):
+    """Tudo o que não pisca na introdução: grade, bordas, título e recorde"""
+    # Efeito de grade/linhas no fundo (estilo arcade)
+    for i in range(0, HEIGHT, 20):
+        pygame.draw.line(surface, (20, 20, 40), (0, i), (WIDTH, i), 1)
+    for i in range(0, WIDTH, 20):
+        pygame.draw.line(surface, (20, 20, 40), (i, 0), (i, HEIGHT), 1)
+
+    # Bordas decorativas estilo arcade
+    pygame.draw.rect(surface, (100, 100, 100), (10, 10, WIDTH - 20, HEIGHT - 20), 3)
+    pygame.draw.rect(surface, (50, 50, 50), (15, 15, WIDTH - 30, HEIGHT - 30), 1)
+
+    # Título com sombra (efeito 3D)
+    title_text = render_text("SPACE ESCAPE", 96, YELLOW)
+    title_shadow = render_text("SPACE ESCAPE", 96, (100, 100, 0))
+    centered(surface, title_shadow, 154, 4)
+    centered(surface, title_shadow, 153, 3)
+    centered(surface, title_text, 150)
+
+    centered(surface, render_text("Arcade Edition", 36, (200, 200, 200)), 250)
+    pygame.draw.line(surface, (100, 100, 100), (WIDTH // 2 - 150, 290), (WIDTH // 2 + 150, 290), 2)
+
+    centered(surface, render_text("HIGH SCORE", 32, (150, 150, 150)), 310)
+    centered(surface, render_text(f"{score:05d}", 32, YELLOW), 340)
+
+    centered(surface, render_text("Press any key to continue", 24, (100, 100, 100)), HEIGHT - 80)
+    version_text = render_text("Alpha 0.3", 20, (80, 80, 80))
+    surface.blit(version_text, (WIDTH - version_text.get_width() - 10, HEIGHT - 25))
+
+
+def build_press_start(surface):
+    """Overlay transparente com o "PRESS START" que pisca"""
+    centered(surface, render_text("★ INSERT COIN ★", 36, (255, 200, 0)), 0)
+    insert_text = render_text("PRESS START", 56, (255, 255, 255))
+    centered(surface, render_text("PRESS START", 56, (50, 50, 50)), 53, 3)
+    centered(surface, insert_text, 50)
+
+
+def build_menu_background(surface, score, name):
+    centered(surface, render_text("🚀 SPACE ESCAPE", 72, YELLOW), 30)
+    centered(surface, render_text(f"🏆 HIGH SCORE: {score} pts ({name})", 32, YELLOW), 110)
+    centered(surface, render_text("Use ↑↓ para navegar, ENTER para selecionar", 28, WHITE), HEIGHT - 50)
+
+
+def build_menu_options(surface, selected):
+    """Opções do menu com a selecionada em destaque (desenhadas a partir de y=0)"""
+    for idx, option in enumerate(MENU_OPTIONS):
+        color = YELLOW if selected == idx else WHITE
+        centered(surface, render_text(option, 48, color), idx * 80)
+
+
+def build_high_scores_background(surface):
+    centered(surface, render_text("🏆 HIGH SCORE 🏆", 72, YELLOW), 40)
+
+
+def build_high_scores_page(surface, page, entries):
+    """Linhas de uma página do placar mais a instrução (desenhadas a partir de y=130)"""
+    if not entries:
+        centered(surface, render_text("Nenhuma partida registrada", 32, WHITE), 120)
+    for idx, entry in enumerate(entries):
+        position = page * HIGH_SCORES_PER_PAGE + idx + 1
+        color = YELLOW if position == 1 else WHITE
+        y = idx * 36
+        surface.blit(render_text(f"{position:>3}.", 32, color), (90, y))
+        surface.blit(render_text(entry["name"], 32, color), (150, y))
+        surface.blit(render_text(f"{entry['score']:05d}", 32, color), (420, y))
+        surface.blit(render_text(entry["date"], 28, (150, 150, 150)), (530, y + 3))
+    centered(surface, render_text(f"Página {page + 1}   ←→ trocar página, outra tecla volta", 28, WHITE),
+             HEIGHT - 50 - 130)
+
+
+# Camadas compartilhadas pelas telas; cada uma só é refeita quando seus
+# parâmetros mudam
+intro_background = CachedLayer((WIDTH, HEIGHT), build_intro_background, fill=(0, 0, 0))
+press_start_overlay = CachedLayer((WIDTH, 110), build_press_start)
+menu_background = CachedLayer((WIDTH, HEIGHT), build_menu_background, fill=MENU_BACKGROUND)
+menu_options = CachedLayer((WIDTH, 80 * len(MENU_OPTIONS)), build_menu_options, fill=MENU_BACKGROUND)
+high_scores_background = CachedLayer((WIDTH, HEIGHT), build_high_scores_background, fill=MENU_BACKGROUND)
+high_scores_page = CachedLayer((WIDTH, HEIGHT - 130), build_high_scores_page, fill=MENU_BACKGROUND)
 
 
 # ----------------------------------------------------------
 # SISTEMA DE HIGH SCORE
 # ----------------------------------------------------------
-HIGH_SCORE_FILE = "high_score.json"
+def show_high_scores(screen, idle, board):
+    """Mostra o placar, uma página por vez (←→ trocam de página)"""
+    page = 0
+    entries = board.page(page, HIGH_SCORES_PER_PAGE)
+    layers = LayeredScreen(screen)
+
+    def compose(surface):
+        surface.blit(high_scores_background.get(), (0, 0))
+        surface.blit(high_scores_page.get(page, entries), (0, 130))
 
-def load_high_score():
-    """Carrega o HIGH SCORE máximo do arquivo JSON"""
-    if not os.path.exists(HIGH_SCORE_FILE):
-        return {"score": 0, "name": "---", "date": "---"}
-    
-    try:
-        with open(HIGH_SCORE_FILE, 'r') as f:
-            high_score = json.load(f)
-        return high_score
-    except Exception as e:
-        print(f"Erro ao carregar high score: {e}")
-        return {"score": 0, "name": "---", "date": "---"}
-
-
-def save_high_score(score, player_name="Jogador"):
-    """Salva um novo HIGH SCORE se a pontuação for maior que a anterior"""
-    current_high_score = load_high_score()
-    
-    if score > current_high_score["score"]:
-        new_entry = {
-            "name": player_name if player_name.strip() else "Jogador",
-            "score": score,
-            "date": datetime.now().strftime("%d/%m/%Y %H:%M")
-        }
-        
-        try:
-            with open(HIGH_SCORE_FILE, 'w') as f:
-                json.dump(new_entry, f, indent=4)
-            return True
-        except Exception as e:
-            print(f"Erro ao salvar high score: {e}")
-            return False
-    
-    return False
-
-
-def is_high_score(score):
-    """Verifica se a pontuação é um novo HIGH SCORE"""
-    current_high_score = load_high_score()
-    return score > current_high_score["score"]
-
-
-def show_high_scores():
-    """Mostra o HIGH SCORE máximo na tela"""
-    high_score = load_high_score()
-    
     show_running = True
     while show_running:
-        screen.fill((10, 10, 30))
-        
-        # Título
-        title_font = pygame.font.Font(None, 72)
-        title_text = title_font.render("🏆 HIGH SCORE 🏆", True, YELLOW)
-        screen.blit(title_text, (WIDTH // 2 - title_text.get_width() // 2, 80))
-        
-        # Exibir high score
-        score_font = pygame.font.Font(None, 48)
-        name_text = score_font.render(f"Jogador: {high_score['name']}", True, WHITE)
-        score_text = score_font.render(f"Pontos: {high_score['score']}", True, YELLOW)
-        date_text = pygame.font.Font(None, 32).render(f"Data: {high_score['date']}", True, WHITE)
-        
-        screen.blit(name_text, (WIDTH // 2 - name_text.get_width() // 2, 200))
-        screen.blit(score_text, (WIDTH // 2 - score_text.get_width() // 2, 280))
-        screen.blit(date_text, (WIDTH // 2 - date_text.get_width() // 2, 350))
-        
-        # Instrução
-        instruction_font = pygame.font.Font(None, 28)
-        instruction_text = instruction_font.render("Pressione qualquer tecla para voltar", True, WHITE)
-        screen.blit(instruction_text, (WIDTH // 2 - instruction_text.get_width() // 2, HEIGHT - 50))
-        
-        pygame.display.flip()
-        
-        for event in pygame.event.get():
+        layers.present(page, compose)
+
+        # Nada muda sozinho nesta tela: dorme até a próxima tecla
+        for event in idle.wait():
             if event.type == pygame.QUIT:
                 return False
+            if event.type == pygame.WINDOWEXPOSED:  # Janela descoberta: desenha de novo
+                layers.invalidate()
             if event.type == pygame.KEYDOWN:
-                show_running = False
-        
-        clock.tick(FPS)
-    
+                if event.key == pygame.K_RIGHT and len(entries) == HIGH_SCORES_PER_PAGE:
+                    next_entries = board.page(page + 1, HIGH_SCORES_PER_PAGE)
+                    if next_entries:
+                        page += 1
+                        entries = next_entries
+                elif event.key == pygame.K_LEFT and page > 0:
+                    page -= 1
+                    entries = board.page(page, HIGH_SCORES_PER_PAGE)
+                elif event.key not in (pygame.K_LEFT, pygame.K_RIGHT):
+                    show_running = False
+
     return True
 
 
-player_rect = player_img.get_rect(center=(WIDTH // 2, HEIGHT - 60))
-player_speed = 7
+def read_inputs(keys):
+    """Converte o estado do teclado na máscara de entradas do núcleo"""
+    inputs = 0
+    if keys[pygame.K_LEFT]:
+        inputs |= INPUT_LEFT
+    if keys[pygame.K_RIGHT]:
+        inputs |= INPUT_RIGHT
+    if keys[pygame.K_UP]:
+        inputs |= INPUT_UP
+    if keys[pygame.K_DOWN]:
+        inputs |= INPUT_DOWN
+    if keys[pygame.K_SPACE]:
+        inputs |= INPUT_FIRE
+    return inputs
+
+
+def report_saves(save_writer):
+    """Avisa no console as gravações que a thread de save terminou"""
+    for saved in save_writer.poll():
+        if saved:
+            print("✓ Jogo salvo com sucesso!")
+        else:
+            print("✗ Erro ao salvar o jogo")
+
+
+def parse_address(address, default_host="127.0.0.1"):
+    """'HOST:PORTA' ou só 'PORTA' -> (host, porta)"""
+    host, _, port = address.rpartition(":")
+    return host or default_host, int(port) if port else DEFAULT_PORT
+
+
+def start_spectator_server(address):
+    host, port = address
+    spectators = SpectatorServer(host, port)
+    print(f"✓ Transmitindo a partida em {host}:{spectators.start()}")
+    return spectators
+
+
+def main(save_format=FORMAT_JSON, tick_rate=TICK_RATE, render_fps=FPS, dirty_rects=True,
+         record_path=None, seed=None, profile_csv=None, pixel_collisions=True, serve=None,
+         governor_enabled=True):
+    # Só o necessário para a introdução; o áudio sobe numa thread e as
+    # imagens do jogo carregam quando a partida começa
+    pygame.display.init()
+    pygame.font.init()
+
+    pygame.display.set_caption("🚀 Space Escape")
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    assets = AssetManager()
+    assets.load_audio_async([ASSETS["sound_point"], ASSETS["sound_hit"]], ASSETS["music"])
+    sound_files = {EVENT_POINT: ASSETS["sound_point"], EVENT_HIT: ASSETS["sound_hit"]}
+    audio = AudioScheduler(assets.sound, sound_files)
+
+    board = Leaderboard()
+    save_writer = SaveWriter(save_format)
+    rewind_buffer = RewindBuffer(tick_rate=tick_rate)
+    state = GameState(seed)
+
+    hud = HudLine(36, WHITE)
+    clock = pygame.time.Clock()
+
+    # Telas fora do jogo esperam eventos em vez de girar a 60 FPS; o
+    # movimento do mouse não interessa a nenhuma tela e só acordaria o loop
+    idle = IdleLoop()
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+    # ----------------------------------------------------------
+    # TELA DE INTRODUÇÃO - ESTILO "INSERT COIN"
+    # ----------------------------------------------------------
+    intro_running = True
+    intro_blink_interval = 500  # Pisca a cada 500ms
+
+    # A tela só é recomposta quando o recorde ou a fase do pisca mudam
+    layers = LayeredScreen(screen)
+    first_frame_ms = None
+
+    def compose_intro(surface):
+        surface.blit(intro_background.get(high_score), (0, 0))
+        if blink_on:
+            surface.blit(press_start_overlay.get(), (0, PRESS_START_Y))
+
+    while intro_running:
+        current_time_intro = pygame.time.get_ticks()
+
+        high_score = board.best()["score"]
+        blink_on = (current_time_intro // intro_blink_interval) % 2 == 0
+        if layers.present((high_score, blink_on), compose_intro) and first_frame_ms is None:
+            first_frame_ms = (time.perf_counter() - LAUNCH_TIME) * 1000
+            print(f"✓ Primeiro quadro em {first_frame_ms:.0f} ms desde o início do módulo "
+                  f"(imports {(IMPORTS_DONE - LAUNCH_TIME) * 1000:.0f} ms, o resto em janela e assets)")
+
+        # Dorme até um evento ou até a próxima troca do pisca
+        next_blink = intro_blink_interval - current_time_intro % intro_blink_interval
+        for event in idle.wait(next_blink):
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                exit()
+            if event.type == pygame.WINDOWEXPOSED:
+                layers.invalidate()
+            if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+                intro_running = False
 
-meteor_list = []
-METEOR_TYPE_NORMAL = 0
-METEOR_TYPE_BONUS = 1
-METEOR_TYPE_POWERUP = 2  # Meteoro especial que adiciona capacidades
+    # Menu de início com opções
+    menu_running = True
+    menu_y = 0
 
-# Sistema de power-ups da nave
-POWERUP_TYPE_SHIELD = 0
-POWERUP_TYPE_WEAPON = 1
+    layers.invalidate()
 
-player_shield = 0  # Número de escudos ativos (0-3)
-player_weapon_upgrade = False  # Arma melhorada ativa
-weapon_upgrade_time = 0  # Tempo restante do upgrade de arma
-WEAPON_UPGRADE_DURATION = 15000  # 15 segundos
+    def compose_menu(surface):
+        surface.blit(menu_background.get(high_score["score"], high_score["name"]), (0, 0))
+        surface.blit(menu_options.get(menu_y), (0, 200))
 
-for _ in range(5):
-    x = random.randint(0, WIDTH - 40)
-    y = random.randint(-500, -40)
-    rand = random.randint(1, 20)
-    if rand == 1:
-        meteor_type = METEOR_TYPE_POWERUP
-    elif rand <= 3:
-        meteor_type = METEOR_TYPE_BONUS
-    else:
-        meteor_type = METEOR_TYPE_NORMAL
-    meteor_list.append([pygame.Rect(x, y, 40, 40), meteor_type])
+    while menu_running:
+        high_score = board.best()
+        layers.present((high_score["score"], high_score["name"], menu_y), compose_menu)
 
-meteor_speed = 5
+        for event in idle.wait():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                exit()
+            if event.type == pygame.WINDOWEXPOSED:
+                layers.invalidate()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP:
+                    menu_y = (menu_y - 1) % len(MENU_OPTIONS)
+                elif event.key == pygame.K_DOWN:
+                    menu_y = (menu_y + 1) % len(MENU_OPTIONS)
+                elif event.key == pygame.K_RETURN:
+                    if menu_y == 0:  # Novo Jogo
+                        menu_running = False
+                    elif menu_y == 1:  # High Score
+                        show_high_scores(screen, idle, board)
+                        layers.invalidate()
+                    elif menu_y == 2:  # Sair
+                        pygame.quit()
+                        exit()
+
+    # Verificar se há jogo salvo ao iniciar
+    saved_state = load_game()
+    if saved_state:
+        apply_saved_state(state, saved_state)
+
+        print("✓ Jogo carregado com sucesso!")
+        print(f"  Pontuação: {state.score} | Vidas: {state.lives} | Escudos: {state.player_shield}")
+
+    # Imagens do jogo: carregadas agora, no primeiro uso (ou do cache em disco)
+    sprites = GameSprites(assets)
+    print(assets.report())
+    masks = sprites.collision_masks() if pixel_collisions else None
+
+    # O relógio da simulação segue o do pygame, como antes
+    state.time = pygame.time.get_ticks()
+    frame_profiler = FrameProfiler(csv_path=profile_csv)
+    spectators = start_spectator_server(serve) if serve else None
+    # Mede o trabalho de cada quadro e alivia o desenho quando o orçamento estoura
+    governor = QualityGovernor(budget_ms=1000 / (render_fps or FPS), enabled=governor_enabled)
+    recorder = (InputRecorder(state, tick_rate, loaded_save=bool(saved_state), pixel_collisions=masks is not None)
+                if record_path else None)
+
+    # Passo fixo: a simulação avança sempre em ticks de `tick` ms e o
+    # desenho interpola entre os dois últimos ticks
+    tick = tick_ms(tick_rate)
+
+    # O fundo é restaurado só onde algo foi desenhado no quadro anterior
+    renderer = DirtyRenderer(screen, sprites.background, enabled=dirty_rects)
+
+    # Os menus esperam eventos sem passar pelo clock: zera a contagem aqui
+    # para o tempo parado neles e na carga não virar ticks no primeiro quadro
+    clock.tick()
+    accumulator = 0.0
+    # R só volta no próximo tick, como no replay; vários R antes dele viram um só
+    rewind_pending = False
+
+    # ----------------------------------------------------------
+    # LOOP PRINCIPAL
+    # ----------------------------------------------------------
+    while state.running:
+        frame_ms = clock.tick(render_fps)
+        accumulator += min(frame_ms, MAX_FRAME_MS)
+        # Tempo gasto no quadro anterior, sem a espera do clock; quadros
+        # travados (menus, janela arrastada) não contam como carga
+        if frame_ms <= MAX_FRAME_MS:
+            governor.update(clock.get_rawtime())
+        quality = governor.settings
+
+        # Desligado, cada fase custa só o teste de `profiler`
+        profiler = frame_profiler if frame_profiler.enabled else None
+        if profiler:
+            profiler.begin_frame()
+
+        renderer.begin()
+
+        # Eventos
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                state.running = False
+            if event.type == pygame.WINDOWEXPOSED:  # Janela descoberta: este quadro vai inteiro
+                renderer.invalidate()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_s:  # Pressionar 'S' para salvar (em segundo plano)
+                    save_writer.submit(snapshot_state(state))
+                    if recorder:
+                        recorder.flag(INPUT_SAVE)
+                elif event.key == pygame.K_r:  # Pressionar 'R' para voltar alguns segundos
+                    rewind_pending = True
+                elif event.key == pygame.K_F3:  # F3 mostra/esconde os tempos por fase
+                    frame_profiler.toggle_overlay()
+
+        report_saves(save_writer)
+
+        if not state.running:
+            break
+
+        if profiler:
+            profiler.mark(PHASE_EVENTS)
+
+        inputs = read_inputs(pygame.key.get_pressed())
+        if profiler:
+            profiler.mark(PHASE_INPUT)
+
+        ticks_this_frame = 0
+        while accumulator >= tick and state.running:
+            if rewind_pending:
+                rewind_buffer.rewind(state, REWIND_STEP_SECONDS * tick_rate)
+                rewind_pending = False
+                if recorder:
+                    recorder.flag(INPUT_REWIND)
+            if recorder:
+                recorder.record(inputs)
+            for game_event in step(state, inputs, tick, masks, profiler):
+                audio.request(game_event)
+            rewind_buffer.maybe_capture(state)
+            if spectators:
+                spectators.publish(state)
+            if profiler:
+                profiler.mark(PHASE_TICK_EXTRAS)
+            accumulator -= tick
+            ticks_this_frame += 1
+            if ticks_this_frame >= MAX_TICKS_PER_FRAME:
+                # Máquina lenta demais: descarta o atraso em vez de entrar em espiral
+                accumulator %= tick
+                break
 
-missiles = []
-missile_speed = 10
+        # Sons pedidos pelos ticks do quadro: no máximo um por categoria
+        audio.flush(pygame.time.get_ticks())
+        if profiler:
+            profiler.mark(PHASE_TICK_EXTRAS)
+
+        # Fração do próximo tick já decorrida (0 = último tick, 1 = próximo)
+        alpha = accumulator / tick
+        lag = 1.0 - alpha
+
+        # ------------------------------------------------------
+        # DESENHAR SPRITES
+        # ------------------------------------------------------
+        draw_game(renderer, state, sprites, lag, quality)
+
+        # Sprites do quadro saem num único Surface.blits, antes do HUD por cima
+        renderer.flush()
+        if profiler:
+            profiler.mark(PHASE_DRAW)
+
+        # Informações do jogo (só os campos que mudaram são renderizados de
+        # novo); sob carga o texto é refeito só de tantos em tantos quadros
+        if renderer.frames % quality["hud_every"] == 0:
+            info_fields = [f"Pontos: {state.score}", f"Vidas: {state.lives}", f"Escudos: {state.player_shield}"]
+            if state.player_weapon_upgrade:
+                remaining_time = int((state.weapon_upgrade_time - state.time) // 1000)
+                info_fields.append(f"🔫 Arma: {remaining_time}s")
+            info_fields.append("[S: Salvar]")
+            info_fields.append("[R: Voltar]")
+            hud.update(info_fields)
+        renderer.mark(hud.draw(screen, (10, 10)))
+        if profiler:
+            profiler.mark(PHASE_HUD)
+
+        if frame_profiler.overlay:
+            overlay = frame_profiler.overlay_image()
+            renderer.draw(overlay, (WIDTH - 260, 50))
+            lines = [f"qualidade: {quality['name']} ({len(governor.transitions)} trocas)"]
+            if masks:
+                lines.append(f"máscaras: {masks.last_frame_tests}/quadro")
+            top = 54 + overlay.get_height()
+            for n, line in enumerate(lines):
+                renderer.draw(render_text(line, 20, (200, 255, 200)), (WIDTH - 254, top + n * 18))
+
+        if masks:
+            masks.end_frame()
+
+        # Só as regiões que mudaram vão para a janela
+        renderer.end()
+        if profiler:
+            profiler.mark(PHASE_FLIP)
+            profiler.end_frame()
+
+    score = state.score
+    if recorder and recorder.save(record_path, state):
+        print(f"✓ Replay gravado em {record_path} ({len(recorder.inputs)} ticks)")
+    save_writer.close()
+    report_saves(save_writer)
+    if spectators:
+        spectators.close()
+        print(spectators.report())
+    print(rewind_buffer.report())
+    print(audio.report())
+    print(renderer.report())
+    print(governor.report())
+    if masks:
+        print(masks.report())
+    if frame_profiler.frames:
+        print(frame_profiler.report())
+    frame_profiler.close()
+
+    # ----------------------------------------------------------
+    # GAME OVER
+    # ----------------------------------------------------------
+    assets.stop_music()
+
+    # Verificar se é novo high score
+    new_high_score = board.is_high_score(score)
+    position = board.rank(score)
+
+    # Toda partida entra no placar
+    board.add(score)
+
+    if score >= CONDICAO_VITORIA:
+        end_message = "VITÓRIA! O MUNDO ESTÁ SALVO!"
+        screen.fill(BLUE)
+        final_message_color = YELLOW
+    else:
+        end_message = "Fim de jogo! Pressione qualquer tecla para sair."
+        screen.fill((50, 50, 50))
+        final_message_color = RED
 
-FIRE_COOLDOWN = 300
-last_shot_time = 0
+    end_text = render_text(end_message, 36, final_message_color)
+    final_score = render_text(f"Pontuação final: {score}", 36, WHITE)
 
-explosion_img = load_image("explosão.png", (255, 100, 0), (60, 60))
-explosions = []
-EXPLOSION_DURATION = 200
+    screen.blit(end_text, (WIDTH // 2 - end_text.get_width() // 2, HEIGHT // 2 - 50))
+    screen.blit(final_score, (WIDTH // 2 - final_score.get_width() // 2, HEIGHT // 2))
 
-score = 0
-lives = 3
+    position_text = render_text(f"Posição no placar: {position}º", 28, WHITE)
+    screen.blit(position_text, (WIDTH // 2 - position_text.get_width() // 2, HEIGHT // 2 + 100))
 
-font = pygame.font.Font(None, 36)
-clock = pygame.time.Clock()
+    # Mostrar se é novo high score
+    if new_high_score:
+        high_score_text = render_text("🌟 NOVO HIGH SCORE! 🌟", 36, YELLOW)
+        screen.blit(high_score_text, (WIDTH // 2 - high_score_text.get_width() // 2, HEIGHT // 2 + 50))
 
-# ----------------------------------------------------------
-# TELA DE INTRODUÇÃO - ESTILO "INSERT COIN"
-# ----------------------------------------------------------
-intro_running = True
-intro_blink_interval = 500  # Pisca a cada 500ms
-
-while intro_running:
-    clock.tick(FPS)
-    current_time_intro = pygame.time.get_ticks()
-    
-    # Fundo escuro estilo arcade
-    screen.fill((0, 0, 0))
-    
-    # Efeito de grade/linhas no fundo (estilo arcade)
-    for i in range(0, HEIGHT, 20):
-        pygame.draw.line(screen, (20, 20, 40), (0, i), (WIDTH, i), 1)
-    for i in range(0, WIDTH, 20):
-        pygame.draw.line(screen, (20, 20, 40), (i, 0), (i, HEIGHT), 1)
-    
-    # Bordas decorativas estilo arcade
-    pygame.draw.rect(screen, (100, 100, 100), (10, 10, WIDTH - 20, HEIGHT - 20), 3)
-    pygame.draw.rect(screen, (50, 50, 50), (15, 15, WIDTH - 30, HEIGHT - 30), 1)
-    
-    # Título principal grande e chamativo
-    title_font_large = pygame.font.Font(None, 96)
-    title_text = title_font_large.render("SPACE ESCAPE", True, YELLOW)
-    title_shadow = title_font_large.render("SPACE ESCAPE", True, (100, 100, 0))
-    
-    # Desenhar sombra do título (efeito 3D)
-    screen.blit(title_shadow, (WIDTH // 2 - title_text.get_width() // 2 + 4, 154))
-    screen.blit(title_shadow, (WIDTH // 2 - title_text.get_width() // 2 + 3, 153))
-    screen.blit(title_text, (WIDTH // 2 - title_text.get_width() // 2, 150))
-    
-    # Subtítulo
-    subtitle_font = pygame.font.Font(None, 36)
-    subtitle_text = subtitle_font.render("Arcade Edition", True, (200, 200, 200))
-    screen.blit(subtitle_text, (WIDTH // 2 - subtitle_text.get_width() // 2, 250))
-    
-    # Linha decorativa
-    pygame.draw.line(screen, (100, 100, 100), (WIDTH // 2 - 150, 290), (WIDTH // 2 + 150, 290), 2)
-    
-    # Exibir HIGH SCORE na tela de introdução
-    high_score = load_high_score()
-    hs_font = pygame.font.Font(None, 32)
-    hs_label = hs_font.render("HIGH SCORE", True, (150, 150, 150))
-    hs_text = hs_font.render(f"{high_score['score']:05d}", True, YELLOW)
-    screen.blit(hs_label, (WIDTH // 2 - hs_label.get_width() // 2, 310))
-    screen.blit(hs_text, (WIDTH // 2 - hs_text.get_width() // 2, 340))
-    
-    # Texto "INSERT COIN" ou "PRESS START" piscando
-    if (current_time_intro // intro_blink_interval) % 2 == 0:
-        insert_font = pygame.font.Font(None, 56)
-        insert_text = insert_font.render("PRESS START", True, (255, 255, 255))
-        insert_shadow = insert_font.render("PRESS START", True, (50, 50, 50))
-        
-        # Desenhar sombra (efeito 3D)
-        screen.blit(insert_shadow, (WIDTH // 2 - insert_text.get_width() // 2 + 3, HEIGHT - 150 + 3))
-        screen.blit(insert_text, (WIDTH // 2 - insert_text.get_width() // 2, HEIGHT - 150))
-        
-        # Efeito de moedas/asteriscos decorativos
-        coin_font = pygame.font.Font(None, 36)
-        coin_text = coin_font.render("★ INSERT COIN ★", True, (255, 200, 0))
-        screen.blit(coin_text, (WIDTH // 2 - coin_text.get_width() // 2, HEIGHT - 200))
-    
-    # Instrução adicional (sempre visível)
-    instruction_font = pygame.font.Font(None, 24)
-    instruction_text = instruction_font.render("Press any key to continue", True, (100, 100, 100))
-    screen.blit(instruction_text, (WIDTH // 2 - instruction_text.get_width() // 2, HEIGHT - 80))
-    
-    # Copyright/versão
-    version_font = pygame.font.Font(None, 20)
-    version_text = version_font.render("Alpha 0.3", True, (80, 80, 80))
-    screen.blit(version_text, (WIDTH - version_text.get_width() - 10, HEIGHT - 25))
-    
-    pygame.display.flip()
-    
-    # Verificar eventos
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            exit()
-        if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-            intro_running = False
-
-# Menu de início com opções
-menu_escolha = None
-menu_running = True
-menu_y = 0
-
-while menu_running:
-    screen.fill((10, 10, 30))
-    
-    # Título
-    title_font = pygame.font.Font(None, 72)
-    title_text = title_font.render("🚀 SPACE ESCAPE", True, YELLOW)
-    screen.blit(title_text, (WIDTH // 2 - title_text.get_width() // 2, 30))
-    
-    # Exibir HIGH SCORE atual
-    high_score = load_high_score()
-    high_score_font = pygame.font.Font(None, 32)
-    hs_text = high_score_font.render(f"🏆 HIGH SCORE: {high_score['score']} pts ({high_score['name']})", True, YELLOW)
-    screen.blit(hs_text, (WIDTH // 2 - hs_text.get_width() // 2, 110))
-    
-    # Menu options
-    menu_font = pygame.font.Font(None, 48)
-    options = ["NOVO JOGO", "HIGH SCORE", "SAIR"]
-    
-    for idx, option in enumerate(options):
-        color = YELLOW if menu_y == idx else WHITE
-        option_text = menu_font.render(option, True, color)
-        screen.blit(option_text, (WIDTH // 2 - option_text.get_width() // 2, 200 + idx * 80))
-    
-    # Instruções
-    instruction_font = pygame.font.Font(None, 28)
-    instruction_text = instruction_font.render("Use ↑↓ para navegar, ENTER para selecionar", True, WHITE)
-    screen.blit(instruction_text, (WIDTH // 2 - instruction_text.get_width() // 2, HEIGHT - 50))
-    
     pygame.display.flip()
-    
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            exit()
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_UP:
-                menu_y = (menu_y - 1) % len(options)
-            elif event.key == pygame.K_DOWN:
-                menu_y = (menu_y + 1) % len(options)
-            elif event.key == pygame.K_RETURN:
-                if menu_y == 0:  # Novo Jogo
-                    menu_running = False
-                elif menu_y == 1:  # High Score
-                    show_high_scores()
-                elif menu_y == 2:  # Sair
-                    pygame.quit()
-                    exit()
-    
-    clock.tick(FPS)
-
-# Verificar se há jogo salvo ao iniciar
-saved_state = load_game()
-if saved_state:
-    score = saved_state["score"]
-    lives = saved_state["lives"]
-    player_rect.x = saved_state["player_x"]
-    player_rect.y = saved_state["player_y"]
-    
-    # Restaurar power-ups
-    player_shield = saved_state.get("shield", 0)
-    player_weapon_upgrade = saved_state.get("weapon_upgrade", False)
-    weapon_upgrade_time = saved_state.get("weapon_upgrade_time", 0)
-    
-    # Reconstruir lista de meteoros
-    meteor_list = []
-    for meteor_data in saved_state["meteors"]:
-        meteor_rect = pygame.Rect(meteor_data["x"], meteor_data["y"], 40, 40)
-        meteor_type = meteor_data.get("type", METEOR_TYPE_NORMAL)
-        meteor_list.append([meteor_rect, meteor_type])
-    
-    print("✓ Jogo carregado com sucesso!")
-    print(f"  Pontuação: {score} | Vidas: {lives} | Escudos: {player_shield}")
-
-running = True
-
-# ----------------------------------------------------------
-# LOOP PRINCIPAL
-# ----------------------------------------------------------
-while running:
-    clock.tick(FPS)
-    current_time = pygame.time.get_ticks()
-
-    screen.blit(background, (0, 0))
-
-    # Eventos
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_s:  # Pressionar 'S' para salvar
-                if save_game(score, lives, (player_rect.x, player_rect.y), meteor_list, 
-                           player_shield, player_weapon_upgrade, weapon_upgrade_time):
-                    print("✓ Jogo salvo com sucesso!")
-                else:
-                    print("✗ Erro ao salvar o jogo")
-
-    keys = pygame.key.get_pressed()
-
-    if keys[pygame.K_LEFT] and player_rect.left > 0:
-        player_rect.x -= player_speed
-    if keys[pygame.K_RIGHT] and player_rect.right < WIDTH:
-        player_rect.x += player_speed
-    if keys[pygame.K_UP] and player_rect.top > 0:
-        player_rect.y -= player_speed
-    if keys[pygame.K_DOWN] and player_rect.bottom < HEIGHT:
-        player_rect.y += player_speed
-
-    # ------------------------------------------------------
-    # DISPARO
-    # ------------------------------------------------------
-    # Atualizar duração do upgrade de arma
-    if player_weapon_upgrade and current_time > weapon_upgrade_time:
-        player_weapon_upgrade = False
-    
-    # Cooldown reduzido se tiver upgrade de arma
-    fire_cooldown = FIRE_COOLDOWN // 2 if player_weapon_upgrade else FIRE_COOLDOWN
-    
-    if keys[pygame.K_SPACE] and current_time - last_shot_time > fire_cooldown:
-        last_shot_time = current_time
-        
-        if player_weapon_upgrade:
-            # Disparo triplo quando tem upgrade de arma
-            missiles.append(pygame.Rect(player_rect.centerx - 3, player_rect.top - 20, 6, 20))
-            missiles.append(pygame.Rect(player_rect.left + 10, player_rect.top - 20, 6, 20))
-            missiles.append(pygame.Rect(player_rect.right - 16, player_rect.top - 20, 6, 20))
-        else:
-            # Disparo normal
-            missile_rect = pygame.Rect(
-                player_rect.centerx - 3,
-                player_rect.top - 20,
-                6, 20
-            )
-            missiles.append(missile_rect)
-
-    # ------------------------------------------------------
-    # MÍSSEIS
-    # ------------------------------------------------------
-    for missile in missiles[:]:
-        missile.y -= missile_speed
-
-        if missile.bottom < 0:
-            missiles.remove(missile)
-            continue
-
-        for meteor_data in meteor_list[:]:
-            meteor_rect, meteor_type = meteor_data
-            
-            if missile.colliderect(meteor_rect):
-
-                missiles.remove(missile)
-
-                exp_rect = explosion_img.get_rect(center=meteor_rect.center)
-                explosions.append([explosion_img, exp_rect, pygame.time.get_ticks()])
-
-                meteor_list.remove(meteor_data)
-                rand = random.randint(1, 20)
-                if rand == 1:
-                    new_meteor_type = METEOR_TYPE_POWERUP
-                elif rand <= 3:
-                    new_meteor_type = METEOR_TYPE_BONUS
-                else:
-                    new_meteor_type = METEOR_TYPE_NORMAL
-                new_meteor_rect = pygame.Rect(
-                    random.randint(0, WIDTH - 40),
-                    random.randint(-300, -40),
-                    40, 40
-                )
-                meteor_list.append([new_meteor_rect, new_meteor_type])
-
-                score += 5 if meteor_type == METEOR_TYPE_NORMAL else 10
-                
-                break
 
-    # ------------------------------------------------------
-    # METEOROS
-    # ------------------------------------------------------
-    for meteor_data in meteor_list[:]: 
-        meteor_rect, meteor_type = meteor_data
-        meteor_rect.y += meteor_speed
-
-        if meteor_rect.y > HEIGHT:
-            meteor_list.remove(meteor_data)
-            rand = random.randint(1, 20)
-            if rand == 1:
-                new_meteor_type = METEOR_TYPE_POWERUP
-            elif rand <= 3:
-                new_meteor_type = METEOR_TYPE_BONUS
-            else:
-                new_meteor_type = METEOR_TYPE_NORMAL
-            new_meteor_rect = pygame.Rect(
-                random.randint(0, WIDTH - 40),
-                random.randint(-100, -40),
-                40, 40
-            )
-            meteor_list.append([new_meteor_rect, new_meteor_type])
-        
-            if meteor_type == METEOR_TYPE_NORMAL:
-                score += 1
-                if sound_point:
-                    sound_point.play()
-            
-            continue 
-
-        if meteor_rect.colliderect(player_rect):
-            
-            if meteor_type == METEOR_TYPE_NORMAL:
-                # Verificar se tem escudo
-                if player_shield > 0:
-                    player_shield -= 1
-                    if sound_point:
-                        sound_point.play()
-                else:
-                    lives -= 1
-                    if sound_hit:
-                        sound_hit.play()
-            elif meteor_type == METEOR_TYPE_BONUS:
-                lives += 1
-                if sound_point: 
-                    sound_point.play()
-            elif meteor_type == METEOR_TYPE_POWERUP:
-                # Aplicar power-up aleatório (escudo ou arma)
-                powerup_type = random.choice([POWERUP_TYPE_SHIELD, POWERUP_TYPE_WEAPON])
-                
-                if powerup_type == POWERUP_TYPE_SHIELD:
-                    player_shield = min(player_shield + 2, 3)  # Adiciona 2 escudos, máximo 3
-                else:  # POWERUP_TYPE_WEAPON
-                    player_weapon_upgrade = True
-                    weapon_upgrade_time = current_time + WEAPON_UPGRADE_DURATION
-                
-                if sound_point:
-                    sound_point.play()
-                
-            # Remover o meteoro antigo
-            meteor_list.remove(meteor_data)
-            rand = random.randint(1, 20)
-            if rand == 1:
-                new_meteor_type = METEOR_TYPE_POWERUP
-            elif rand <= 3:
-                new_meteor_type = METEOR_TYPE_BONUS
-            else:
-                new_meteor_type = METEOR_TYPE_NORMAL
-            new_meteor_rect = pygame.Rect(
-                random.randint(0, WIDTH - 40),
-                random.randint(-100, -40),
-                40, 40
-            )
-            meteor_list.append([new_meteor_rect, new_meteor_type])
-
-            if lives <= 0:
-                running = False
-    # ------------------------------------------------------
-    # DESENHAR SPRITES
-    # ------------------------------------------------------
-    # Desenhar escudo ao redor da nave se tiver escudos ativos
-    if player_shield > 0:
-        shield_alpha = 100 + (player_shield * 50)
-        shield_surface = pygame.Surface((player_rect.width + 20, player_rect.height + 20), pygame.SRCALPHA)
-        pygame.draw.ellipse(shield_surface, (100, 200, 255, shield_alpha), 
-                          (0, 0, player_rect.width + 20, player_rect.height + 20), 3)
-        screen.blit(shield_surface, (player_rect.x - 10, player_rect.y - 10))
-    
-    screen.blit(player_img, player_rect)
-
-    for meteor_data in meteor_list:
-        meteor_rect, meteor_type = meteor_data
-        screen.blit(meteor_img, meteor_rect)
-        if meteor_type == METEOR_TYPE_BONUS:
-            pygame.draw.circle(screen, GREEN, meteor_rect.center, meteor_rect.width // 4)
-        elif meteor_type == METEOR_TYPE_POWERUP:
-            # Desenhar um círculo ciano/azul brilhante para indicar power-up
-            pygame.draw.circle(screen, (0, 255, 255), meteor_rect.center, meteor_rect.width // 2, 3)
-            pygame.draw.circle(screen, (100, 200, 255), meteor_rect.center, meteor_rect.width // 3)
-
-    for missile in missiles:
-        screen.blit(missile_img, missile)
-
-    # ------------------------------------------------------
-    # EXPLOSÕES
-    # ------------------------------------------------------
-    for exp in explosions[:]:
-        img, rect, start_time = exp
-
-        screen.blit(img, rect)
-
-        if pygame.time.get_ticks() - start_time > EXPLOSION_DURATION:
-            explosions.remove(exp)
-
-    # Informações do jogo
-    info_text = f"Pontos: {score}   Vidas: {lives}   Escudos: {player_shield}"
-    if player_weapon_upgrade:
-        remaining_time = (weapon_upgrade_time - current_time) // 1000
-        info_text += f"   🔫 Arma: {remaining_time}s"
-    info_text += "   [S: Salvar]"
-    text = font.render(info_text, True, WHITE)
-    screen.blit(text, (10, 10))
-
-    pygame.display.flip()
+    waiting = True
+    while waiting:
+        for event in idle.wait():
+            if event.type == pygame.QUIT:
+                waiting = False
+            if event.type == pygame.WINDOWEXPOSED:
+                pygame.display.flip()  # A tela de fim continua na superfície
+            if event.type == pygame.KEYDOWN:
+                waiting = False
+
+    # Mostrar high scores ao final
+    show_high_scores(screen, idle, board)
+    print(idle.report())
+    print(board.report())
+
+    board.close()
+    pygame.quit()
+
+
+def main_headless(ticks, seed):
+    """Roda o núcleo sem janela e sem limitar o FPS, para testes de balanceamento"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    result = run_headless(ticks, seed=seed)
+    scores = result["scores"]
+    print(f"✓ {result['ticks']} ticks em {result['seconds']:.2f}s "
+          f"({result['ticks_per_second']:.0f} ticks/s)")
+    print(f"  Pares de colisão por tick: {result['collision_pairs'] / ticks:.2f} "
+          f"(sem grade: {result['naive_collision_pairs'] / ticks:.2f})")
+    if scores:
+        print(f"  Partidas: {len(scores)} | Média: {sum(scores) / len(scores):.1f} | Máximo: {max(scores)}")
+
+
+def main_batch(games, ticks, seed):
+    """Roda `games` partidas em lote no ambiente NumPy, para bots e balanceamento"""
+    result = run_batch(games, ticks, seed=seed)
+    scores = result["scores"]
+    print(f"✓ {result['games']} partidas x {result['ticks']} ticks em {result['seconds']:.2f}s "
+          f"({result['game_ticks_per_second']:.0f} ticks de partida/s)")
+    if scores:
+        print(f"  Partidas terminadas: {len(scores)} | Média: {sum(scores) / len(scores):.1f} | "
+              f"Máximo: {max(scores)}")
+
+
+def main_serve(address, seed, tick_rate=TICK_RATE):
+    """Partida sem janela, com a política aleatória em tempo real, só para
+    transmitir; recomeça a cada game over. Ctrl+C encerra."""
+    rng = random.Random(seed)
+    policy = random_policy(rng)
+    state = GameState(seed=rng.randrange(2 ** 32))
+    spectators = start_spectator_server(address)
+    tick = tick_ms(tick_rate)
+    next_tick = time.perf_counter()
+    try:
+        while True:
+            step(state, next(policy), tick)
+            spectators.publish(state)
+            if not state.running:
+                state = GameState(seed=rng.randrange(2 ** 32))
+            next_tick += tick / 1000
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+    except KeyboardInterrupt:
+        pass
+    spectators.close()
+    print(spectators.report())
+
+
+async def watch(client, screen, sprites, hud):
+    """Desenha o estado recebido enquanto outra tarefa lê o fluxo"""
+    try:
+        await client.connect()
+    except OSError as e:
+        print(f"✗ Não foi possível conectar em {client.host}:{client.port}: {e}")
+        return False
+    renderer = DirtyRenderer(screen, sprites.background)
+    receiver = asyncio.create_task(client.run())
+    state = GameState(seed=0)  # Só recebe o espelho para o draw_game
+    frame_time = 1 / FPS
+    while not receiver.done():
+        if any(event.type == pygame.QUIT for event in pygame.event.get()):
+            break
+        mirror = client.mirror
+        if mirror.ready:
+            mirror.fill_state(state)
+            renderer.begin()
+            draw_game(renderer, state, sprites, 0.0)
+            renderer.flush()
+            hud.update([f"Pontos: {state.score}", f"Vidas: {state.lives}", f"Escudos: {state.player_shield}",
+                        f"[Assistindo: tick {mirror.tick}]"])
+            renderer.mark(hud.draw(screen, (10, 10)))
+            renderer.end()
+        await asyncio.sleep(frame_time)
+    receiver.cancel()
+    client.close()
+    return True
 
 
-# ----------------------------------------------------------
-# GAME OVER
-# ----------------------------------------------------------
-pygame.mixer.music.stop()
-
-CONDICAO_VITORIA = 500
-
-# Verificar se é novo high score
-new_high_score = is_high_score(score)
-
-if score >= CONDICAO_VITORIA:
-    end_message = "VITÓRIA! O MUNDO ESTÁ SALVO!"
-    screen.fill(BLUE) 
-    final_message_color = YELLOW
-else:
-    end_message = "Fim de jogo! Pressione qualquer tecla para sair."
-    screen.fill((50, 50, 50)) 
-    final_message_color = RED
-
-end_text = font.render(end_message, True, final_message_color)
-final_score = font.render(f"Pontuação final: {score}", True, WHITE)
-
-screen.blit(end_text, (WIDTH // 2 - end_text.get_width() // 2, HEIGHT // 2 - 50))
-screen.blit(final_score, (WIDTH // 2 - final_score.get_width() // 2, HEIGHT // 2))
-
-# Mostrar se é novo high score
-if new_high_score:
-    high_score_text = font.render("🌟 NOVO HIGH SCORE! 🌟", True, YELLOW)
-    screen.blit(high_score_text, (WIDTH // 2 - high_score_text.get_width() // 2, HEIGHT // 2 + 50))
-    
-    # Salvar high score
-    save_high_score(score)
-
-pygame.display.flip()
-
-waiting = True
-while waiting:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            waiting = False
-        if event.type == pygame.KEYDOWN:
-            waiting = False
-
-# Mostrar high scores ao final
-show_high_scores()
-
-pygame.quit()
+def main_watch(address):
+    """Cliente espectador: abre uma janela e mostra a partida transmitida"""
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_caption("🚀 Space Escape - Espectador")
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    sprites = GameSprites(AssetManager())
+    client = SpectatorClient(*address)
+    connected = asyncio.run(watch(client, screen, sprites, HudLine(36, WHITE)))
+    if connected:
+        print(client.report())
+    pygame.quit()
+    return connected
+
+
+def main_replay(path):
+    """Refaz uma partida gravada com --record e confere pontuação e vidas"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    recording = load_replay(path)
+    masks = None
+    if recording["flags"] & REPLAY_PIXEL_COLLISIONS:
+        # As máscaras saem dos sprites, que precisam de uma tela (a dummy basta)
+        pygame.display.init()
+        pygame.display.set_mode((WIDTH, HEIGHT))
+        masks = GameSprites(AssetManager()).collision_masks()
+
+    result = run_replay(recording, masks=masks)
+    print(f"{'✓' if result['match'] else '✗'} Replay de {result['ticks']} ticks em {result['seconds']:.2f}s "
+          f"({result['ticks_per_second']:.0f} ticks/s)")
+    print(f"  Pontuação: {result['score']} (gravada: {result['expected_score']}) | "
+          f"Vidas: {result['lives']} (gravadas: {result['expected_lives']})")
+    return result["match"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Space Escape")
+    parser.add_argument("--headless", action="store_true", help="roda a simulação sem janela nem relógio")
+    parser.add_argument("--ticks", type=int, default=100000, help="ticks a simular no modo headless")
+    parser.add_argument("--batch", type=int, metavar="K", default=0,
+                        help="com --headless, roda K partidas de uma vez no ambiente vetorizado")
+    parser.add_argument("--seed", type=int, default=None, help="semente do gerador aleatório")
+    parser.add_argument("--save-format", choices=[FORMAT_JSON, FORMAT_BINARY], default=FORMAT_JSON,
+                        help="formato do arquivo gravado com a tecla S")
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE, help="ticks de simulação por segundo")
+    parser.add_argument("--full-redraw", action="store_true",
+                        help="redesenha a tela inteira a cada quadro em vez de só as regiões que mudaram")
+    parser.add_argument("--fps", type=int, default=FPS, help="limite de quadros desenhados por segundo (0 = sem limite)")
+    parser.add_argument("--record", metavar="ARQUIVO", help="grava a semente e as teclas da partida")
+    parser.add_argument("--profile-csv", metavar="ARQUIVO",
+                        help="grava o tempo de cada fase de cada quadro num CSV (F3 mostra o overlay)")
+    parser.add_argument("--fixed-quality", action="store_true",
+                        help="desliga o ajuste automático de qualidade quando os quadros ficam lentos")
+    parser.add_argument("--rect-collisions", action="store_true",
+                        help="colisão só pelos retângulos, sem o teste por pixel das máscaras")
+    parser.add_argument("--serve", metavar="[HOST:]PORTA", type=parse_address,
+                        help="transmite a partida para espectadores (com --headless, uma partida automática)")
+    parser.add_argument("--watch", metavar="HOST:PORTA", type=parse_address,
+                        help="assiste a uma partida transmitida com --serve")
+    parser.add_argument("--replay", metavar="ARQUIVO", help="refaz sem janela uma partida gravada com --record")
+    args = parser.parse_args()
+    if args.ticks <= 0:
+        parser.error("--ticks precisa ser maior que zero")
+    if args.tick_rate <= 0:
+        parser.error("--tick-rate precisa ser maior que zero")
+    if args.fps < 0:
+        parser.error("--fps não pode ser negativo")
+    if args.batch < 0:
+        parser.error("--batch não pode ser negativo")
+
+    if args.replay:
+        exit(0 if main_replay(args.replay) else 1)
+    elif args.watch:
+        exit(0 if main_watch(args.watch) else 1)
+    elif args.headless and args.serve:
+        main_serve(args.serve, args.seed, args.tick_rate)
+    elif args.headless and args.batch:
+        main_batch(args.batch, args.ticks, args.seed)
+    elif args.headless:
+        main_headless(args.ticks, args.seed)
+    else:
+        main(save_format=args.save_format, tick_rate=args.tick_rate, render_fps=args.fps,
+             dirty_rects=not args.full_redraw, record_path=args.record, seed=args.seed,
+             profile_csv=args.profile_csv, pixel_collisions=not args.rect_collisions,
+             serve=args.serve, governor_enabled=not args.fixed_quality)
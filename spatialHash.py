@@ -0,0 +1,114 @@
+##############################################################
+###        S P A C E   E S C A P E  -  G R A D E           ###
+##############################################################
+### Fase larga das colisões: uma grade uniforme com células ###
+### do tamanho de um meteoro (40x40). Cada míssil só testa ###
+### os meteoros das células que ele toca.                  ###
+##############################################################
+
+CELL_SIZE = 40
+
+
+class SpatialHash:
+    """Grade uniforme que guarda itens pelas células que o retângulo cobre.
+
+    A grade é mantida de forma incremental (insert/remove nos spawns). Como
+    os meteoros caem todos com a mesma velocidade, a grade vive no
+    referencial deles: shift() desloca o campo inteiro em O(1) e nenhum
+    item muda de célula. move() fica para itens que se movem sozinhos.
+    """
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.items = {}  # item -> [(ordem de inserção, item), faixa de células]
+        self.next_seq = 0
+        self.offset_y = 0  # Deslocamento acumulado do campo
+
+        # Contadores do tick atual (zerados por reset_stats)
+        self.pairs = 0  # Pares que chegaram ao colliderect
+        self.naive_pairs = 0  # Pares que o teste todos-contra-todos faria
+
+    def _span(self, rect):
+        cs = self.cell_size
+        top = rect.top - self.offset_y
+        return (rect.left // cs, (rect.right - 1) // cs,
+                top // cs, (top + rect.height - 1) // cs)
+
+    def _add(self, entry, span):
+        cells = self.cells
+        x0, x1, y0, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    cell.append(entry)
+
+    def _discard(self, entry, span):
+        cells = self.cells
+        x0, x1, y0, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells[(cx, cy)]
+                cell.remove(entry)
+                if not cell:
+                    del cells[(cx, cy)]
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+        self.next_seq = 0
+        self.offset_y = 0
+
+    def insert(self, item, rect):
+        """Insere um item (hashável, ex.: o índice do meteoro); a ordem de
+        inserção é a ordem devolvida por query()"""
+        span = self._span(rect)
+        entry = (self.next_seq, item)
+        self.next_seq += 1
+        self._add(entry, span)
+        self.items[item] = [entry, span]
+
+    def remove(self, item):
+        record = self.items.pop(item, None)
+        if record is not None:
+            self._discard(*record)
+
+    def move(self, item, rect):
+        """Atualiza a posição de um item que já está na grade"""
+        record = self.items[item]
+        span = self._span(rect)
+        if span != record[1]:
+            self._discard(record[0], record[1])
+            self._add(record[0], span)
+            record[1] = span
+
+    def shift(self, dy):
+        """Desloca verticalmente todos os itens da grade"""
+        self.offset_y += dy
+
+    def rebuild(self, pairs):
+        """Reconstrói a grade a partir de pares (item, rect)"""
+        self.clear()
+        for item, rect in pairs:
+            self.insert(item, rect)
+
+    def query(self, rect):
+        """Itens das células cobertas por rect, sem repetição, na ordem de inserção"""
+        cells = self.cells
+        found = {}
+        x0, x1, y0, y1 = self._span(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        if len(found) > 1:
+            return [found[seq] for seq in sorted(found)]
+        return list(found.values())
+
+    def reset_stats(self):
+        self.pairs = 0
+        self.naive_pairs = 0
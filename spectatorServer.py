@@ -0,0 +1,403 @@
+##############################################################
+###     S P A C E   E S C A P E  -  E S P E C T A D O R    ###
+##############################################################
+### Servidor asyncio que transmite a partida a cada tick:  ###
+### o primeiro pacote é o estado inteiro; depois só vão os ###
+### meteoros e mísseis que fugiram do deslocamento comum   ###
+### do tick (renasceram, foram disparados, sumiram). Um    ###
+### cliente lento recebe só o estado mais recente quando   ###
+### volta a ter espaço, e é desligado se travar de vez.    ###
+##############################################################
+
+import asyncio
+import socket
+import struct
+import threading
+
+import numpy as np
+
+DEFAULT_PORT = 50550
+MAX_CLIENT_BUFFER = 256 * 1024  # Bytes na fila de envio antes de segurar o cliente
+STALL_TIMEOUT = 5.0  # Segundos sem conseguir enviar até desligar o cliente
+
+MSG_SNAPSHOT = 1
+MSG_DELTA = 2
+
+# Tipo e tamanho de cada mensagem
+MSG_HEADER = struct.Struct("<BI")
+# Tick, relógio, pontos, vidas, escudos, arma, ms restantes da arma, nave
+# (x, y) e quantidades de meteoros, mísseis e explosões
+WORLD_HEADER = struct.Struct("<IdiiBBIhhIHH")
+# No delta: deslocamento comum de meteoros e mísseis e quantos mudaram fora dele
+DELTA_HEADER = struct.Struct("<iiIH")
+
+
+class WorldFrame:
+    """Cópia do que o espectador precisa de um tick; segura para outra thread"""
+
+    def __init__(self, state, meteor_travel, missile_travel):
+        meteors = state.meteors
+        n = meteors.size
+        self.tick = state.ticks
+        self.time = state.time
+        self.score = state.score
+        self.lives = state.lives
+        self.shield = state.player_shield
+        self.weapon = state.player_weapon_upgrade
+        self.weapon_left = max(0, int(state.weapon_upgrade_time - state.time)) if self.weapon else 0
+        self.player = state.player_rect.topleft
+
+        self.meteor_x = meteors.x[:n].astype(np.int16)
+        self.meteor_y = meteors.y[:n].astype(np.int16)
+        self.meteor_type = meteors.type[:n].copy()
+        missiles = state.missiles
+        self.missile_x = np.array([rect.x for rect in missiles], dtype=np.int16)
+        self.missile_y = np.array([rect.y for rect in missiles], dtype=np.int16)
+        explosions = state.explosions
+        self.explosions = np.array([(rect.x, rect.y, state.time - start)
+                                    for rect, start in zip(explosions, explosions.values)],
+                                   dtype=np.int16).reshape(-1, 3)
+        # Deslocamento acumulado desde o início da transmissão
+        self.meteor_travel = meteor_travel
+        self.missile_travel = missile_travel
+
+    def header(self):
+        return WORLD_HEADER.pack(
+            self.tick, self.time, self.score, self.lives, self.shield, self.weapon, self.weapon_left,
+            self.player[0], self.player[1], len(self.meteor_x), len(self.missile_x), len(self.explosions))
+
+    def snapshot_size(self):
+        return (WORLD_HEADER.size + len(self.meteor_x) * 5 + len(self.missile_x) * 4
+                + len(self.explosions) * 6)
+
+    def snapshot(self):
+        return b"".join((
+            self.header(),
+            self.meteor_x.tobytes(), self.meteor_y.tobytes(), self.meteor_type.tobytes(),
+            self.missile_x.tobytes(), self.missile_y.tobytes(),
+            self.explosions.tobytes(),
+        ))
+
+    def delta(self, base):
+        """Só as entidades que não estão onde `base` mais o deslocamento comum
+        as colocaria; índices novos (slots além do base) vão sempre"""
+        meteor_dy = self.meteor_travel - base.meteor_travel
+        n, common = len(self.meteor_x), min(len(self.meteor_x), len(base.meteor_x))
+        meteor_changed = np.ones(n, dtype=bool)
+        meteor_changed[:common] = ((self.meteor_x[:common] != base.meteor_x[:common])
+                                   | (self.meteor_y[:common] != base.meteor_y[:common] + meteor_dy)
+                                   | (self.meteor_type[:common] != base.meteor_type[:common]))
+        meteors = meteor_changed.nonzero()[0].astype(np.uint32)
+
+        missile_dy = self.missile_travel - base.missile_travel
+        n, common = len(self.missile_x), min(len(self.missile_x), len(base.missile_x))
+        missile_changed = np.ones(n, dtype=bool)
+        missile_changed[:common] = ((self.missile_x[:common] != base.missile_x[:common])
+                                    | (self.missile_y[:common] != base.missile_y[:common] - missile_dy))
+        missiles = missile_changed.nonzero()[0].astype(np.uint16)
+
+        return b"".join((
+            self.header(),
+            DELTA_HEADER.pack(meteor_dy, missile_dy, len(meteors), len(missiles)),
+            meteors.tobytes(), self.meteor_x[meteors].tobytes(), self.meteor_y[meteors].tobytes(),
+            self.meteor_type[meteors].tobytes(),
+            missiles.tobytes(), self.missile_x[missiles].tobytes(), self.missile_y[missiles].tobytes(),
+            self.explosions.tobytes(),
+        ))
+
+
+def encode_message(msg_type, payload):
+    return MSG_HEADER.pack(msg_type, len(payload)) + payload
+
+
+# ----------------------------------------------------------
+# SERVIDOR
+# ----------------------------------------------------------
+class SpectatorLink:
+    """Um cliente conectado: o último quadro que ele recebeu é a base do delta"""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.task = asyncio.current_task()
+        self.wake = asyncio.Event()
+        self.base = None
+        self.sent_tick = None
+        self.skipped = 0  # Ticks que este cliente não recebeu por estar lento
+
+
+class SpectatorServer:
+    """Servidor de espectadores num loop asyncio em thread própria.
+
+    O jogo chama publish(state) a cada tick, da sua thread; cada cliente
+    tem uma tarefa que envia o quadro mais recente e espera o drain. Se o
+    cliente está lento os quadros intermediários são pulados (o delta é
+    sempre contra o que ele de fato recebeu)."""
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT,
+                 max_buffer=MAX_CLIENT_BUFFER, stall_timeout=STALL_TIMEOUT):
+        self.host = host
+        self.port = port  # 0 = porta livre qualquer; a real fica aqui depois do start()
+        self.max_buffer = max_buffer
+        self.stall_timeout = stall_timeout
+
+        self.loop = None
+        self.thread = None
+        self.server = None
+        self.links = set()
+        self.latest = None
+        self.meteor_travel = 0
+        self.missile_travel = 0
+
+        self.clients_served = 0
+        self.clients_dropped = 0
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.snapshot_bytes = 0  # O que teria ido mandando sempre o estado inteiro
+        self.skipped = 0
+
+    def start(self):
+        """Abre a porta e devolve o número dela"""
+        ready = threading.Event()
+        errors = []
+
+        def run():
+            self.loop = asyncio.new_event_loop()
+            try:
+                self.server = self.loop.run_until_complete(
+                    asyncio.start_server(self._serve, self.host, self.port))
+                self.port = self.server.sockets[0].getsockname()[1]
+            except OSError as e:
+                errors.append(e)
+                ready.set()
+                return
+            ready.set()
+            self.loop.run_forever()
+            self.loop.close()
+
+        self.thread = threading.Thread(target=run, name="spectator-server", daemon=True)
+        self.thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        return self.port
+
+    def publish(self, state):
+        """Copia o tick atual da partida e acorda os clientes"""
+        self.meteor_travel += state.meteor_dy
+        self.missile_travel += state.missile_dy
+        if not self.links:
+            return
+        frame = WorldFrame(state, self.meteor_travel, self.missile_travel)
+        self.loop.call_soon_threadsafe(self._set_latest, frame)
+
+    def _set_latest(self, frame):
+        self.latest = frame
+        for link in self.links:
+            link.wake.set()
+
+    async def _serve(self, reader, writer):
+        # Fila curta também no kernel: o atraso de um cliente lento aparece
+        # logo no drain em vez de virar segundos de ticks velhos no socket
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.max_buffer)
+        writer.transport.set_write_buffer_limits(high=self.max_buffer)
+        link = SpectatorLink(writer)
+        self.links.add(link)
+        self.clients_served += 1
+        try:
+            while True:
+                await link.wake.wait()
+                link.wake.clear()
+                frame = self.latest
+                if link.base is None:
+                    data = encode_message(MSG_SNAPSHOT, frame.snapshot())
+                else:
+                    link.skipped += max(0, frame.tick - link.sent_tick - 1)  # Partida nova recomeça o tick
+                    data = encode_message(MSG_DELTA, frame.delta(link.base))
+                writer.write(data)
+                self.frames_sent += 1
+                self.bytes_sent += len(data)
+                self.snapshot_bytes += MSG_HEADER.size + frame.snapshot_size()
+                link.base = frame
+                link.sent_tick = frame.tick
+                # Espera a fila de envio baixar; enquanto isso novos ticks só
+                # substituem self.latest
+                await asyncio.wait_for(writer.drain(), self.stall_timeout)
+        except asyncio.TimeoutError:
+            self.clients_dropped += 1
+            # Os ticks publicados depois do último envio também foram perdidos
+            link.skipped += max(0, self.latest.tick - link.sent_tick - 1)
+        except (ConnectionError, OSError, asyncio.CancelledError):
+            pass
+        finally:
+            self.links.discard(link)
+            self.skipped += link.skipped
+            writer.close()
+
+    def close(self):
+        if self.loop is None:
+            return
+
+        async def shutdown():
+            self.server.close()
+            tasks = [link.task for link in self.links]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result(timeout=5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+        self.loop = None
+
+    def report(self):
+        if not self.frames_sent:
+            return f"Espectadores: {self.clients_served} conectados, nada enviado"
+        ratio = self.bytes_sent / self.snapshot_bytes
+        skipped = self.skipped + sum(link.skipped for link in list(self.links))
+        return (f"Espectadores: {self.clients_served} conectados, {self.frames_sent} pacotes, "
+                f"{self.bytes_sent / 1024:.1f} KB ({ratio:.0%} do estado inteiro a cada tick), "
+                f"{skipped} ticks pulados por lentidão, {self.clients_dropped} desligados")
+
+
+# ----------------------------------------------------------
+# CLIENTE
+# ----------------------------------------------------------
+class WorldMirror:
+    """Reconstrói do lado do cliente o estado transmitido"""
+
+    def __init__(self):
+        self.tick = 0
+        self.time = 0
+        self.score = 0
+        self.lives = 0
+        self.shield = 0
+        self.weapon = False
+        self.weapon_left = 0
+        self.player = (0, 0)
+        self.meteor_x = np.zeros(0, dtype=np.int16)
+        self.meteor_y = np.zeros(0, dtype=np.int16)
+        self.meteor_type = np.zeros(0, dtype=np.int8)
+        self.missile_x = np.zeros(0, dtype=np.int16)
+        self.missile_y = np.zeros(0, dtype=np.int16)
+        self.explosions = np.zeros((0, 3), dtype=np.int16)
+        self.ready = False  # Já recebeu o primeiro estado inteiro
+
+    def _read_header(self, payload):
+        (self.tick, self.time, self.score, self.lives, self.shield, weapon, self.weapon_left,
+         player_x, player_y, meteors, missiles, explosions) = WORLD_HEADER.unpack_from(payload)
+        self.weapon = bool(weapon)
+        self.player = (player_x, player_y)
+        return meteors, missiles, explosions
+
+    @staticmethod
+    def _resize(array, n):
+        if len(array) == n:
+            return array
+        resized = np.zeros(n, dtype=array.dtype)
+        resized[:min(n, len(array))] = array[:n]
+        return resized
+
+    def apply(self, msg_type, payload):
+        meteors, missiles, explosions = self._read_header(payload)
+        view = memoryview(payload)
+        offset = WORLD_HEADER.size
+
+        def take(dtype, count):
+            nonlocal offset
+            array = np.frombuffer(view, dtype=dtype, count=count, offset=offset)
+            offset += array.nbytes
+            return array
+
+        if msg_type == MSG_SNAPSHOT:
+            self.meteor_x = take(np.int16, meteors).copy()
+            self.meteor_y = take(np.int16, meteors).copy()
+            self.meteor_type = take(np.int8, meteors).copy()
+            self.missile_x = take(np.int16, missiles).copy()
+            self.missile_y = take(np.int16, missiles).copy()
+            self.ready = True
+        elif msg_type == MSG_DELTA and self.ready:
+            meteor_dy, missile_dy, meteor_changes, missile_changes = DELTA_HEADER.unpack_from(payload, offset)
+            offset += DELTA_HEADER.size
+            # Todo mundo anda o deslocamento comum; depois vêm as exceções
+            self.meteor_y += meteor_dy
+            self.missile_y -= missile_dy
+            self.meteor_x = self._resize(self.meteor_x, meteors)
+            self.meteor_y = self._resize(self.meteor_y, meteors)
+            self.meteor_type = self._resize(self.meteor_type, meteors)
+            self.missile_x = self._resize(self.missile_x, missiles)
+            self.missile_y = self._resize(self.missile_y, missiles)
+
+            index = take(np.uint32, meteor_changes)
+            self.meteor_x[index] = take(np.int16, meteor_changes)
+            self.meteor_y[index] = take(np.int16, meteor_changes)
+            self.meteor_type[index] = take(np.int8, meteor_changes)
+            index = take(np.uint16, missile_changes)
+            self.missile_x[index] = take(np.int16, missile_changes)
+            self.missile_y[index] = take(np.int16, missile_changes)
+        else:
+            raise ValueError(f"mensagem inesperada: {msg_type}")
+        self.explosions = take(np.int16, explosions * 3).reshape(-1, 3).copy()
+
+    def fill_state(self, state):
+        """Copia o espelho para um GameState, para desenhar com draw_game"""
+        state.ticks = self.tick
+        state.time = self.time
+        state.score = self.score
+        state.lives = self.lives
+        state.player_shield = self.shield
+        state.player_weapon_upgrade = self.weapon
+        state.weapon_upgrade_time = self.time + self.weapon_left
+        state.player_rect.topleft = self.player
+        state.prev_player_pos = self.player
+        state.meteors.load(self.meteor_x, self.meteor_y, self.meteor_type)
+        state.missiles.clear()
+        for x, y in zip(self.missile_x.tolist(), self.missile_y.tolist()):
+            state.missiles.acquire(x, y)
+        state.explosions.clear()
+        for x, y, age in self.explosions.tolist():
+            state.explosions.acquire(x, y, self.time - age)
+
+
+class SpectatorClient:
+    """Lê o fluxo do servidor e mantém um WorldMirror atualizado"""
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.mirror = WorldMirror()
+        self.reader = None
+        self.writer = None
+        self.messages = 0
+        self.bytes_received = 0
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def receive(self):
+        """Aplica a próxima mensagem; False quando o servidor fechou"""
+        try:
+            msg_type, size = MSG_HEADER.unpack(await self.reader.readexactly(MSG_HEADER.size))
+            payload = await self.reader.readexactly(size)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return False
+        self.mirror.apply(msg_type, payload)
+        self.messages += 1
+        self.bytes_received += MSG_HEADER.size + size
+        return True
+
+    async def run(self):
+        """Recebe até o servidor fechar"""
+        while await self.receive():
+            pass
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    def report(self):
+        return (f"Espectador: {self.messages} pacotes, {self.bytes_received / 1024:.1f} KB recebidos, "
+                f"último tick {self.mirror.tick}")
@@ -0,0 +1,101 @@
+##############################################################
+###         S P A C E   E S C A P E  -  T E X T O S        ###
+##############################################################
+### Fontes criadas uma vez por tamanho e textos renderizados###
+### guardados num cache LRU por (texto, tamanho, cor), para ###
+### as telas não recriarem Font nem Surface a cada quadro. ###
+##############################################################
+
+from collections import OrderedDict
+
+import pygame
+
+TEXT_CACHE_SIZE = 256
+
+_fonts = {}
+
+
+def get_font(size):
+    """Fonte padrão do pygame no tamanho pedido, criada só na primeira vez"""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+
+class TextCache:
+    """Cache LRU limitado de textos já renderizados"""
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, size, color):
+        key = (text, size, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = get_font(size).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+text_cache = TextCache()
+
+
+def render_text(text, size, color):
+    """Atalho para o cache compartilhado"""
+    return text_cache.render(text, size, color)
+
+
+class HudLine:
+    """Linha de HUD formada por campos; só re-renderiza o campo que mudou"""
+
+    def __init__(self, size, color, separator="   "):
+        self.size = size
+        self.color = color
+        self.gap = get_font(size).size(separator)[0]
+        self.texts = []
+        self.surfaces = []
+        self.renders = 0  # Campos renderizados desde o início
+
+    def update(self, fields):
+        """Atualiza os textos dos campos; devolve True se algo mudou"""
+        changed = len(fields) != len(self.texts)
+        if changed:
+            del self.texts[len(fields):]
+            del self.surfaces[len(fields):]
+        font = get_font(self.size)
+        for i, text in enumerate(fields):
+            if i < len(self.texts) and self.texts[i] == text:
+                continue
+            surface = font.render(text, True, self.color)
+            self.renders += 1
+            changed = True
+            if i < len(self.texts):
+                self.texts[i] = text
+                self.surfaces[i] = surface
+            else:
+                self.texts.append(text)
+                self.surfaces.append(surface)
+        return changed
+
+    def draw(self, screen, pos):
+        """Desenha a linha e devolve o retângulo ocupado"""
+        x, y = pos
+        area = pygame.Rect(x, y, 0, 0)
+        for surface in self.surfaces:
+            area.union_ip(screen.blit(surface, (x, y)))
+            x += surface.get_width() + self.gap
+        return area